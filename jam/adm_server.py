@@ -137,6 +137,10 @@ def create_items(task):
     task.sys_params.add_field(32, 'f_history_item', 'History item', common.INTEGER, False, task.sys_items, 'f_name')
     task.sys_params.add_field(33, 'f_lock_item', 'Lock item', common.INTEGER, False, task.sys_items, 'f_name')
     task.sys_params.add_field(34, 'f_sys_group', 'System group', common.INTEGER)
+    task.sys_params.add_field(35, 'f_con_pool_timeout', 'Connection pool timeout', common.INTEGER)
+    task.sys_params.add_field(36, 'f_id_block_size', 'ID block size', common.INTEGER)
+    task.sys_params.add_field(37, 'f_sqlite_wal', 'SQLite WAL mode', common.BOOLEAN)
+    task.sys_params.add_field(38, 'f_read_replicas', 'Read replicas', common.TEXT, size = 1024)
 
     task.sys_items.add_field(1, 'id', 'ID', common.INTEGER, visible=True, edit_visible=False)
     task.sys_items.add_field(2, 'deleted', 'Deleted flag', common.INTEGER, visible=False, edit_visible=False)
@@ -169,6 +173,9 @@ def create_items(task):
     task.sys_items.add_field(29, 'f_edit_lock', 'Edit lock', common.BOOLEAN)
     task.sys_items.add_field(30, 'sys_id', 'sys_id', common.INTEGER)
     task.sys_items.add_field(31, 'f_select_all', task.lang['select_all'], common.BOOLEAN)
+    task.sys_items.add_field(32, 'f_ci_search', 'Case-insensitive search columns', common.BOOLEAN)
+    task.sys_items.add_field(33, 'f_fts', 'Full-text search index', common.BOOLEAN)
+    task.sys_items.add_field(34, 'f_lookup_cache', 'Cache lookups in memory', common.BOOLEAN)
 
     task.sys_items.add_filter('id', 'ID', 'id', common.FILTER_EQ, visible=False)
     task.sys_items.add_filter('not_id', 'ID', 'id', common.FILTER_NE, visible=False)
@@ -665,6 +672,10 @@ def create_admin(app):
     task.task_con_pool_size = common.SETTINGS['CON_POOL_SIZE']
     if task.task_con_pool_size < 1:
         task.task_con_pool_size = 3
+    task.task_con_pool_timeout = common.SETTINGS['CON_POOL_TIMEOUT']
+    task.task_id_block_size = common.SETTINGS['ID_BLOCK_SIZE']
+    task.task_sqlite_wal = common.SETTINGS['SQLITE_WAL']
+    task.task_read_replicas = common.SETTINGS['READ_REPLICAS']
     try:
         task.task_mp_pool = common.SETTINGS['MP_POOL']
         task.task_persist_con = common.SETTINGS['PERSIST_CON']
@@ -703,7 +714,7 @@ def execute(task, task_id, sql, params=None):
         return error
 
 def execute_select(task_id, sql, params=None):
-    return task.execute_select(sql)
+    return task.execute_select(sql, params)
 
 def get_privileges(task, role_id):
     result = {}
@@ -772,7 +783,8 @@ def create_task(app):
             it.f_js_filename.value, it_task.f_db_type.value, it_task.f_alias.value,
             it_task.f_login.value, it_task.f_password.value, it_task.f_host.value,
             it_task.f_port.value, it_task.f_encoding.value, task.task_con_pool_size,
-            task.task_mp_pool, task.task_persist_con
+            task.task_mp_pool, task.task_persist_con, task.task_con_pool_timeout,
+            task.task_id_block_size, task.task_sqlite_wal, task.task_read_replicas
             )
         result.ID = it.id.value
         load_task(result, app)
@@ -917,6 +929,9 @@ def load_task(target, app, first_build=True, after_import=False):
                         item.server_code = rec.f_server_module.value
                         item.keep_history = rec.f_keep_history.value
                         item.select_all = rec.f_select_all.value
+                        item.ci_search = rec.f_ci_search.value
+                        item.fts = rec.f_fts.value
+                        item.lookup_cache = rec.f_lookup_cache.value
                         item._primary_key = rec.f_primary_key.value
                         item._deleted_flag = rec.f_deleted_flag.value
                         item._master_id = rec.f_master_id.value
@@ -2431,7 +2446,7 @@ def get_db_type(task):
     tasks.open()
     return tasks.f_db_type.value
 
-def get_table_fields(item, fields, delta_fields=None):
+def get_table_fields(item, fields, delta_fields=None, ci_search=None):
 
     def field_dict(field):
         if not (field.f_calculated.value or field.f_master_field.value):
@@ -2492,6 +2507,22 @@ def get_table_fields(item, fields, delta_fields=None):
                 field_info = find_field(result, field.id.value)
                 if field_info and not field_info['master_field']:
                     result.remove(field_info)
+    if ci_search is None:
+        ci_search = item.f_ci_search.value
+    if ci_search:
+        for field in list(result):
+            if field['data_type'] == common.TEXT and not field['primary_key']:
+                result.append({
+                    'id': '%s%s' % (field['id'], common.CI_FIELD_SUFFIX),
+                    'field_name': field['field_name'] + common.CI_FIELD_SUFFIX,
+                    'data_type': common.TEXT,
+                    'size': field['size'],
+                    'default_value': None,
+                    'master_field': None,
+                    'primary_key': False,
+                    'ci_field': field['field_name'],
+                    'ci_field_id': field['id']
+                })
     return result
 
 def item_children(task, item_id):
@@ -2558,6 +2589,27 @@ def change_item_sql(item, old_fields, new_fields):
     db_type = get_db_type(item.task)
     return item.change_table_sql(db_type, old_fields, new_fields)
 
+def get_fts_fields(fields):
+    return [field['field_name'] for field in fields if field['data_type'] == common.TEXT and \
+        not field['primary_key'] and not field.get('ci_field')]
+
+def change_fts_sql(item, fields, old_fts, new_fts, old_fields=None):
+    db_module = db_modules.get_db_module(get_db_type(item.task))
+    primary_key = None
+    for field in fields:
+        if field['primary_key']:
+            primary_key = field['field_name']
+    old_list = []
+    if old_fts and old_fields:
+        old_list = get_fts_fields(old_fields)
+    new_list = []
+    if new_fts:
+        new_list = get_fts_fields(fields)
+    result = db_module.change_fts_sql(item.f_table_name.value, primary_key, old_list, new_list) or []
+    for sql in result:
+        print(sql)
+    return result
+
 def update_table(delta):
     if delta.f_virtual_table.value or \
         delta.type_id.value in (common.ITEMS_TYPE, common.TABLES_TYPE, common.REPORTS_TYPE):
@@ -2587,10 +2639,11 @@ def items_insert_sql(item, delta, manual_update=False, foreign_fields=None):
     if update_table(delta) and not manual_update:
         if delta.type_id.value in (common.ITEM_TYPE, common.TABLE_TYPE):
             db_type = get_db_type(item.task)
+            fields = get_table_fields(delta, delta.details.sys_fields)
             sql = delta.create_table_sql(db_type, delta.f_table_name.value, \
-                get_table_fields(delta, delta.details.sys_fields), \
-                delta.f_gen_name.value, \
-                foreign_fields=foreign_fields)
+                fields, delta.f_gen_name.value, foreign_fields=foreign_fields)
+            if delta.f_fts.value:
+                sql += change_fts_sql(delta, fields, False, True)
             return sql
 
 def items_execute_insert(item, delta, manual_update):
@@ -2610,17 +2663,24 @@ def items_execute_insert(item, delta, manual_update):
 def items_update_sql(item, delta, manual_update=False):
     if update_table(delta) and not manual_update:
         if delta.type_id.value in (common.ITEMS_TYPE, common.TABLES_TYPE,
-            common.ITEM_TYPE, common.TABLE_TYPE) and \
-            delta.details.sys_fields.record_count():
+            common.ITEM_TYPE, common.TABLE_TYPE):
             it = item.copy()
             it.filters.id.value = delta.id.value
             it.open()
-            it_fields = it.details.sys_fields
-            it_fields.open()
-            old_fields = get_table_fields(delta, it_fields)
-            new_fields = get_table_fields(delta, it_fields, delta.details.sys_fields)
-            sql = change_item_sql(delta, old_fields, new_fields)
-            return sql
+            if delta.details.sys_fields.record_count() or \
+                bool(it.f_ci_search.value) != bool(delta.f_ci_search.value) or \
+                bool(it.f_fts.value) != bool(delta.f_fts.value):
+                it_fields = it.details.sys_fields
+                it_fields.open()
+                old_fields = get_table_fields(delta, it_fields, ci_search=it.f_ci_search.value)
+                new_fields = get_table_fields(delta, it_fields, delta.details.sys_fields)
+                sql = change_item_sql(delta, old_fields, new_fields)
+                if it.f_fts.value or delta.f_fts.value:
+                    fts_sql = change_fts_sql(delta, new_fields, it.f_fts.value,
+                        delta.f_fts.value, old_fields)
+                    sql = [s for s in fts_sql if s.startswith('DROP')] + sql + \
+                        [s for s in fts_sql if not s.startswith('DROP')]
+                return sql
 
 def items_execute_update(item, delta, manual_update):
     sql = items_update_sql(item, delta, manual_update)
@@ -2638,6 +2698,10 @@ def items_delete_sql(item, delta, manual_update=False):
         if delta.type_id.value in (common.ITEM_TYPE, common.TABLE_TYPE):
             db_type = get_db_type(item.task)
             sql = delta.delete_table_sql(db_type)
+            if delta.f_fts.value:
+                fts_sql = db_modules.get_db_module(db_type).delete_fts_sql(delta.f_table_name.value)
+                if fts_sql:
+                    sql = [fts_sql] + sql
             return sql
 
 def items_execute_delete(item, delta, manual_update):
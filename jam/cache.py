@@ -0,0 +1,222 @@
+import re
+import uuid
+import threading
+import hashlib
+from collections import OrderedDict
+from time import time
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from werkzeug.contrib.cache import SimpleCache
+from werkzeug._compat import string_types
+
+TABLE_RE = re.compile(r'^\s*(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM|ALTER\s+TABLE|DROP\s+TABLE|TRUNCATE(?:\s+TABLE)?)\s+"?([\w$]+)"?', re.I)
+
+def command_tables(command, tables=None):
+    if tables is None:
+        tables = []
+    if isinstance(command, string_types):
+        match = TABLE_RE.match(command)
+        if match:
+            tables.append(match.group(1))
+    elif isinstance(command, tuple):
+        command_tables(command[0], tables)
+    elif isinstance(command, list):
+        for com in command:
+            command_tables(com, tables)
+    return tables
+
+class LRUCache(SimpleCache):
+    """In-process cache that evicts least recently used entries when the
+    number of entries exceeds threshold or the total size of pickled values
+    exceeds max_size bytes.
+    """
+
+    def __init__(self, threshold=500, default_timeout=300, max_size=None):
+        SimpleCache.__init__(self, threshold, default_timeout)
+        self._cache = OrderedDict()
+        self._size = 0
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._size = 0
+        return True
+
+    def _remove(self, key):
+        item = self._cache.pop(key, None)
+        if item is not None:
+            self._size -= len(item[1])
+        return item
+
+    def _prune(self):
+        now = time()
+        for key, (expires, value) in list(self._cache.items()):
+            if expires != 0 and expires <= now:
+                self._remove(key)
+        while self._cache and (len(self._cache) > self._threshold or \
+            self._max_size and self._size > self._max_size):
+            key = next(iter(self._cache))
+            self._remove(key)
+
+    def get(self, key):
+        with self._lock:
+            item = self._remove(key)
+            if item is not None:
+                expires, value = item
+                if expires == 0 or expires > time():
+                    self._cache[key] = item
+                    self._size += len(value)
+                    try:
+                        return pickle.loads(value)
+                    except pickle.PickleError:
+                        return None
+
+    def set(self, key, value, timeout=None):
+        expires = self._normalize_timeout(timeout)
+        value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remove(key)
+            self._cache[key] = (expires, value)
+            self._size += len(value)
+            if len(self._cache) > self._threshold or \
+                self._max_size and self._size > self._max_size:
+                self._prune()
+        return True
+
+    def add(self, key, value, timeout=None):
+        if self.has(key):
+            return False
+        return self.set(key, value, timeout)
+
+    def delete(self, key):
+        with self._lock:
+            return self._remove(key) is not None
+
+    def has(self, key):
+        with self._lock:
+            item = self._cache.get(key)
+            if item is not None:
+                expires = item[0]
+                return expires == 0 or expires > time()
+            return False
+
+
+class ResultCache(object):
+    """Caches select results keyed on the query text, its parameters and
+    the current generation of every table the query reads. Writing to a
+    table replaces its generation, so stale entries are never hit again and
+    simply age out of the backend.
+
+    Any werkzeug BaseCache can be used as backend, for example
+    FileSystemCache or MemcachedCache to share results between processes.
+    """
+
+    def __init__(self, backend=None, prefix='jam_'):
+        if backend is None:
+            backend = LRUCache()
+        self.backend = backend
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    def generation_key(self, table_name):
+        return '%sgen:%s' % (self.prefix, table_name.upper())
+
+    def new_generation(self, key):
+        value = uuid.uuid4().hex
+        self.backend.set(key, value, 0)
+        return value
+
+    def generations(self, tables):
+        keys = [self.generation_key(table) for table in tables]
+        result = []
+        for key, value in zip(keys, self.backend.get_many(*keys)):
+            if value is None:
+                value = self.new_generation(key)
+            result.append(value)
+        return result
+
+    def get_key(self, tables, command, mod_count=0):
+        tables = sorted(set(table.upper() for table in tables))
+        data = pickle.dumps((command, tables, self.generations(tables), mod_count), 2)
+        return self.prefix + hashlib.md5(data).hexdigest()
+
+    def get(self, key):
+        result = self.backend.get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def set(self, key, value, timeout=None):
+        self.backend.set(key, value, timeout)
+
+    def invalidate(self, tables):
+        for table in set(table.upper() for table in tables):
+            self.new_generation(self.generation_key(table))
+
+    def invalidate_command(self, command):
+        tables = command_tables(command)
+        if tables:
+            self.invalidate(tables)
+
+    def clear(self):
+        self.backend.clear()
+
+    def get_stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+class LookupCache(object):
+    """Keeps id -> display value maps of small lookup tables in memory, so
+    selects can fill lookup columns without joining them.
+
+    A map is dropped when its table is written to. When generation is
+    given (a result cache generation token), the map is also reloaded once
+    the token changes, which covers writes made by other processes.
+    """
+
+    def __init__(self):
+        self.maps = {}
+        self.versions = {}
+        self.cleared = 0
+        self.lock = threading.Lock()
+
+    def version(self, table_name):
+        return self.cleared, self.versions.get(table_name, 0)
+
+    def get(self, table_name, field_name, load, generation=None):
+        table_name = table_name.upper()
+        key = (table_name, field_name)
+        entry = self.maps.get(key)
+        if entry is None or entry[0] != generation:
+            version = self.version(table_name)
+            entry = (generation, load())
+            with self.lock:
+                if self.version(table_name) == version:
+                    self.maps[key] = entry
+        return entry[1]
+
+    def invalidate(self, tables):
+        with self.lock:
+            for table in set(table.upper() for table in tables):
+                self.versions[table] = self.versions.get(table, 0) + 1
+                for key in list(self.maps):
+                    if key[0] == table:
+                        del self.maps[key]
+
+    def invalidate_command(self, command):
+        tables = command_tables(command)
+        if tables:
+            self.invalidate(tables)
+
+    def clear(self):
+        with self.lock:
+            self.cleared += 1
+            self.maps = {}
@@ -8,6 +8,7 @@ import locale
 import decimal
 import zipfile
 import gzip
+import zlib
 try:
     from cStringIO import StringIO
 except ImportError:
@@ -36,6 +37,10 @@ DEFAULT_SETTINGS = {
     'D_FMT': '%x',
     'D_T_FMT': '%X',
     'CON_POOL_SIZE': 4,
+    'CON_POOL_TIMEOUT': 0,
+    'ID_BLOCK_SIZE': 0,
+    'SQLITE_WAL': False,
+    'READ_REPLICAS': '',
     'MP_POOL': False,
     'PERSIST_CON': False,
     'SINGLE_FILE_JS': False,
@@ -94,6 +99,7 @@ FILTER_SIGN = ('', '=', '<>', '<', '<=', '>', '>=', 'IN', 'NOT IN',
 FILTER_STRING = ('EQ', 'NE', 'LT', 'LE', 'GT', 'GE', 'IN', 'NOT IN',
     'RANGE', 'ISNULL', 'EXACT', 'CONTAINS', 'STARTWITH', 'ENDWITH', 'CONTAINS_ALL')
 REC_STATUS, REC_CONTROLS_INFO, REC_CHANGE_ID = range(3)
+CI_FIELD_SUFFIX = '_CI'
 
 ORDER_ASC, ORDER_DESC = range(2)
 STATE_INACTIVE, STATE_BROWSE, STATE_INSERT, STATE_EDIT, STATE_DELETE = range(5)
@@ -482,6 +488,14 @@ def compressBuf(buf):
     zfile.close()
     return zbuf.getvalue()
 
+def compressStream(chunks):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
 def profileit(func):
     import cProfile
 
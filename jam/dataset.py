@@ -1,5 +1,6 @@
 import datetime
 import traceback
+import operator
 
 import jam.common as common
 from werkzeug._compat import iteritems, iterkeys, text_type, string_types, to_unicode
@@ -16,9 +17,19 @@ FILTER_DEF = FILTER_OBJ_NAME, FILTER_NAME, FILTER_FIELD_NAME, FILTER_TYPE, FILTE
 class DatasetException(Exception):
     pass
 
-class DBField(object):
-    def __init__(self, owner, field_def):
-        self.owner = owner
+class FieldSchema(object):
+    __slots__ = ('field_def', 'field_kind', 'ID', 'field_name', 'field_caption', 'data_type',
+        'required', 'lookup_item', 'lookup_field', 'lookup_db_field', 'lookup_item1',
+        'lookup_field1', 'lookup_db_field1', 'lookup_item2', 'lookup_field2',
+        'lookup_db_field2', 'read_only', 'view_visible', 'view_index', 'edit_visible',
+        'edit_index', 'expand', 'word_wrap', 'field_size', 'default_value', 'is_default',
+        'calculated', 'editable', 'alignment', 'lookup_values', 'multi_select',
+        'multi_select_all', 'enable_typeahead', 'field_help', 'field_placeholder',
+        'db_field_name', 'field_type', '_filter_schema')
+
+    def __init__(self, field_def=None):
+        if field_def is None:
+            return
         self.field_def = field_def
         self.field_kind = common.ITEM_FIELD
         self.ID = field_def[FIELD_ID]
@@ -27,7 +38,6 @@ class DBField(object):
         self.data_type = field_def[FIELD_DATA_TYPE]
         self.required = field_def[REQUIRED]
         self.lookup_item = field_def[LOOKUP_ITEM]
-        self.master_field = field_def[MASTER_FIELD]
         self.lookup_field = field_def[LOOKUP_FIELD]
         self.lookup_db_field = None
         self.lookup_item1 = None
@@ -56,11 +66,45 @@ class DBField(object):
         self.field_help = field_def[FIELD_HELP]
         self.field_placeholder = field_def[FIELD_PLACEHOLDER]
         self.db_field_name = field_def[DB_FIELD_NAME]
-
         self.field_type = common.FIELD_TYPE_NAMES[self.data_type]
+        self._filter_schema = None
+
+    def copy(self):
+        result = FieldSchema()
+        for name in FieldSchema.__slots__:
+            setattr(result, name, getattr(self, name))
+        result._filter_schema = None
+        return result
+
+    def filter_schema(self):
+        if self._filter_schema is None:
+            result = self.copy()
+            result.field_kind = common.FILTER_FIELD
+            result.lookup_item = None
+            self._filter_schema = result
+        return self._filter_schema
+
+
+class DBField(object):
+    def __init__(self, owner, field_def, schema=None):
+        self.owner = owner
+        if schema is None:
+            self._schema = FieldSchema(field_def)
+            self._shared = False
+        else:
+            self._schema = schema
+            self._shared = True
+        self._base_schema = schema
+        self.master_field = field_def[MASTER_FIELD]
         self.filter = None
         self.on_field_get_text_called = None
 
+    def share_schema(self):
+        if self._base_schema is None:
+            self._base_schema = self._schema
+            self._shared = True
+        return self._base_schema
+
     def get_row(self):
         if self.owner._dataset:
             return self.owner._dataset[self.owner.rec_no]
@@ -201,10 +245,11 @@ class DBField(object):
     def get_raw_value(self):
         try:
             value = self.get_data()
-            if self.data_type == common.DATE:
+            data_type = self._schema.data_type
+            if data_type == common.DATE:
                 if type(value) in string_types:
                     value = self.convert_date(value)
-            elif self.data_type == common.DATETIME:
+            elif data_type == common.DATETIME:
                 if type(value) in string_types:
                     value = self.convert_date_time(value)
             return value
@@ -216,29 +261,30 @@ class DBField(object):
 
     def get_value(self):
         value = self.get_raw_value()
+        data_type = self._schema.data_type
         try:
             if value == None:
-                if self.field_kind == common.ITEM_FIELD:
-                    if self.data_type in (common.FLOAT, common.INTEGER, common.CURRENCY):
+                if self._schema.field_kind == common.ITEM_FIELD:
+                    if data_type in (common.FLOAT, common.INTEGER, common.CURRENCY):
                         value = 0
-                    elif self.data_type == common.BOOLEAN:
+                    elif data_type == common.BOOLEAN:
                         value = False
-                    elif self.data_type == common.TEXT:
+                    elif data_type == common.TEXT:
                         value = ''
-                    elif self.data_type == common.KEYS:
+                    elif data_type == common.KEYS:
                         value = [];
             else:
-                if self.data_type == common.TEXT:
+                if data_type == common.TEXT:
                     if not isinstance(value, text_type):
                         value = to_unicode(value, 'utf-8')
-                if self.data_type in (common.FLOAT, common.CURRENCY):
+                if data_type in (common.FLOAT, common.CURRENCY):
                     value = float(value)
-                elif self.data_type == common.BOOLEAN:
+                elif data_type == common.BOOLEAN:
                     if value:
                         value = True
                     else:
                         value = False
-                elif self.data_type == common.KEYS:
+                elif data_type == common.KEYS:
                     value = self.convert_keys(value)
             return value
         except Exception as e:
@@ -541,10 +587,8 @@ class DBField(object):
 
 class FilterField(DBField):
     def __init__(self, fltr, field, owner):
-        DBField.__init__(self, owner, field.field_def)
-        self.field_kind = common.FILTER_FIELD
+        DBField.__init__(self, owner, field.field_def, field._schema.filter_schema())
         self.filter = fltr
-        self.lookup_item = None
         self._value = None
         self._lookup_value = None
 
@@ -573,6 +617,20 @@ class FilterField(DBField):
     def _set_record_status(self, value):
         pass
 
+def _schema_property(name):
+
+    def set_value(self, value):
+        if self._shared:
+            self._schema = self._schema.copy()
+            self._shared = False
+        setattr(self._schema, name, value)
+
+    return property(operator.attrgetter('_schema.' + name), set_value)
+
+for name in FieldSchema.__slots__:
+    if not name.startswith('_'):
+        setattr(DBField, name, _schema_property(name))
+
 class DBFilter(object):
     def __init__(self, owner, filter_def):
         self.owner = owner
@@ -938,6 +996,9 @@ class AbstractDataSet(object):
         self.field_defs = []
         self._fields = []
         self.fields = []
+        self._fields_index = ({}, {})
+        self._all_fields_index = ({}, {})
+        self._filters_index = {}
         self.filter_defs = []
         self.filters = DBList()
         self.details = DBList()
@@ -973,6 +1034,7 @@ class AbstractDataSet(object):
         self._filtered = False
         self.expanded = True
         self._open_params = {}
+        self.total_records = None
         self._disabled_count = 0
         self._is_delta = False
         self.keep_history = False
@@ -1085,9 +1147,8 @@ class AbstractDataSet(object):
         result.keep_history = self.keep_history
         result.select_all = self.select_all
 
-        for field_def in result.field_defs:
-            field = DBField(result, field_def)
-            result._fields.append(field)
+        for field in self._fields:
+            result._fields.append(DBField(result, field.field_def, field.share_schema()))
         result.prepare_fields()
 
         for filter_def in result.filter_defs:
@@ -1108,9 +1169,8 @@ class AbstractDataSet(object):
         result.field_defs = self.field_defs
         result.filter_defs = self.filter_defs
 
-        for field_def in result.field_defs:
-            field = DBField(result, field_def)
-            result._fields.append(field)
+        for field in self._fields:
+            result._fields.append(DBField(result, field.field_def, field.share_schema()))
         result.prepare_fields()
 
         for field in result.fields:
@@ -1123,6 +1183,7 @@ class AbstractDataSet(object):
             result.fields.append(new_field)
             if not hasattr(result, new_field.field_name):
                 setattr(result, new_field.field_name, new_field)
+        result._fields_index = result._index_fields(result.fields)
         result._bind_fields()
         result._dataset = self._dataset
         if keep_filtered:
@@ -1132,7 +1193,18 @@ class AbstractDataSet(object):
         result.first()
         return result
 
+    def _index_fields(self, fields):
+        by_name = {}
+        by_ID = {}
+        for field in fields:
+            if not field.field_name in by_name:
+                by_name[field.field_name] = field
+            if not field.ID in by_ID:
+                by_ID[field.ID] = field
+        return by_name, by_ID
+
     def prepare_fields(self):
+        self._all_fields_index = self._index_fields(self._fields)
         for field in self._fields:
             if field.lookup_item and type(field.lookup_item) == int:
                 field.lookup_item = self.task.item_by_ID(field.lookup_item)
@@ -1164,6 +1236,7 @@ class AbstractDataSet(object):
                 except:
                     pass
         self.fields = list(self._fields)
+        self._fields_index = self._all_fields_index
         for field in self.fields:
             if not hasattr(self, field.field_name):
                 setattr(self, field.field_name, field)
@@ -1176,35 +1249,53 @@ class AbstractDataSet(object):
                     setattr(self, '%s_%s' % (sys_field_name, 'db_field_name'), field.db_field_name)
 
     def prepare_filters(self):
+        self._filters_index = {}
         for fltr in self.filters:
             setattr(self.filters, fltr.filter_name, fltr)
+            if not fltr.filter_name in self._filters_index:
+                self._filters_index[fltr.filter_name] = fltr
             if fltr.field.lookup_item and type(fltr.field.lookup_item) == int:
                 fltr.field.lookup_item = self.task.item_by_ID(fltr.field.lookup_item)
 
     def field_by_name(self, field_name):
-        for field in self.fields:
-            if field.field_name == field_name:
-                return field
+        result = self._fields_index[0].get(field_name)
+        if result is None:
+            for field in self.fields:
+                if field.field_name == field_name:
+                    return field
+        return result
 
     def _field_by_name(self, field_name):
-        for field in self._fields:
-            if field.field_name == field_name:
-                return field
+        result = self._all_fields_index[0].get(field_name)
+        if result is None:
+            for field in self._fields:
+                if field.field_name == field_name:
+                    return field
+        return result
 
     def field_by_ID(self, id_value):
-        for field in self.fields:
-            if field.ID == id_value:
-                return field
+        result = self._fields_index[1].get(id_value)
+        if result is None:
+            for field in self.fields:
+                if field.ID == id_value:
+                    return field
+        return result
 
     def _field_by_ID(self, id_value):
-        for field in self._fields:
-            if field.ID == id_value:
-                return field
+        result = self._all_fields_index[1].get(id_value)
+        if result is None:
+            for field in self._fields:
+                if field.ID == id_value:
+                    return field
+        return result
 
     def filter_by_name(self, name):
-        for fltr in self.filters:
-            if fltr.filter_name == name:
-                return fltr
+        result = self._filters_index.get(name)
+        if result is None:
+            for fltr in self.filters:
+                if fltr.filter_name == name:
+                    return fltr
+        return result
 
     def _get_log_changes(self):
         return self._log_changes
@@ -1562,6 +1653,21 @@ class AbstractDataSet(object):
         field_list = field_list + list(fields)
         self._order_by_list = self.get_order_by_list(field_list)
 
+    def get_keyset(self):
+        result = []
+        pk_field = self._primary_key_field
+        for field_id, desc in self._open_params.get('__order', []):
+            field = self.field_by_ID(field_id)
+            if field:
+                if field.lookup_item or field.calculated or \
+                    not (field.required or field is pk_field):
+                    return
+                result.append(field.data)
+                if field is pk_field:
+                    return result
+        result.append(pk_field.data)
+        return result
+
     def _update_fields(self, fields):
 
         for field in self.fields:
@@ -1575,8 +1681,10 @@ class AbstractDataSet(object):
                     self.fields.append(field)
                 else:
                     raise Exception('%s - _do_before_open method error: there is no field with field_name: %s' % (self.item_name, field_name))
+            self._fields_index = self._index_fields(self.fields)
         else:
             self.fields = list(self._fields)
+            self._fields_index = self._all_fields_index
         for field in self.fields:
             if not hasattr(self, field.field_name):
                 setattr(self, field.field_name, field)
@@ -1669,11 +1777,15 @@ class AbstractDataSet(object):
     def do_open(self, params=None):
         if not params:
             params = self._open_params
-        rows, error_mes = self.do_internal_open(params)
+        result = self.do_internal_open(params)
+        rows, error_mes = result[0], result[1]
         if error_mes:
             raise RuntimeError(error_mes)
         else:
             self._dataset = rows
+            self.total_records = None
+            if len(result) > 2:
+                self.total_records = result[2]
 
     def close(self):
         self._active = False
@@ -1976,6 +2088,8 @@ class MasterDataSet(AbstractDataSet):
     def __init__(self):
         AbstractDataSet.__init__(self)
         self.details_active = False
+        self._prefetch_details = None
+        self._prefetched = {}
 
     def _copy(self, filters=True, details=True, handlers=True):
         result = super(MasterDataSet, self)._copy(filters, details, handlers)
@@ -2006,6 +2120,7 @@ class MasterDataSet(AbstractDataSet):
             if result:
                 params = result
         self.do_apply(params, safe)
+        self._prefetched = {}
         if self.on_after_apply:
             self.on_after_apply(self)
 
@@ -2048,6 +2163,31 @@ class MasterDataSet(AbstractDataSet):
             if not detail.disabled:
                 detail.open()
 
+    def do_open(self, params=None):
+        super(MasterDataSet, self).do_open(params)
+        self._prefetched = {}
+        if self._prefetch_details:
+            self.prefetch_details(self._prefetch_details)
+
+    def prefetch_details(self, details):
+        self._prefetched = {}
+        if self._dataset and self._primary_key_field in self.fields:
+            index = self._primary_key_field.bind_index
+            ids = []
+            found = set()
+            for row in self._dataset:
+                if not row[index] in found:
+                    found.add(row[index])
+                    ids.append(row[index])
+            for detail_name in details:
+                detail = self.detail_by_name(detail_name)
+                if detail is None:
+                    raise Exception('%s: prefetch_details - there is no detail %s' % (self.item_name, detail_name))
+                if not detail.disabled:
+                    records = detail.prefetch_records(ids)
+                    if not records is None:
+                        self._prefetched[detail.ID] = (detail.expanded, records)
+
     def _do_after_scroll(self):
         if self.details_active:
             self.open_details()
@@ -2073,7 +2213,7 @@ class MasterDetailDataset(MasterDataSet):
 
     def open(self, options=None, expanded=None, fields=None, where=None, order_by=None,
         open_empty=False, params=None, offset=None, limit=None, funcs=None,
-        group_by=None, safe=False):
+        group_by=None, safe=False, prefetch_details=None):
         if safe and not self.can_view():
             raise Exception(self.task.lang['cant_view'] % self.item_caption)
         if options and type(options) == dict:
@@ -2095,6 +2235,8 @@ class MasterDetailDataset(MasterDataSet):
                 limit = options['limit']
             if options.get('funcs'):
                 funcs = options['funcs']
+            if options.get('prefetch_details'):
+                prefetch_details = options['prefetch_details']
         if expanded is None:
             expanded = self.expanded
         else:
@@ -2105,6 +2247,7 @@ class MasterDetailDataset(MasterDataSet):
         if self.master:
             if not self.disabled and self.master.record_count() > 0:
                 records = None
+                prefetched = False
                 if self.master.is_new():
                     records = []
                 else:
@@ -2113,11 +2256,17 @@ class MasterDetailDataset(MasterDataSet):
                         records = log['records']
                         fields = log['fields']
                         expanded = log['expanded']
+                    elif self.ID in self.master._prefetched and self.master._prefetched[self.ID][0] == expanded and \
+                        fields is None and where is None and order_by is None and not params and \
+                        not open_empty and not offset and not limit and not funcs and not group_by:
+                        master_rec_id = self.master.field_by_name(self.master._primary_key).value
+                        records = [list(row) for row in self.master._prefetched[self.ID][1].get(master_rec_id, [])]
+                        prefetched = True
                 if not records is None:
                     self._do_before_open(expanded, fields, where, order_by,
                         open_empty, params, offset, limit, funcs, group_by)
                     self._bind_fields(expanded)
-                    if self.master.is_new():
+                    if self.master.is_new() or prefetched:
                         self.change_log.prepare()
                     self._dataset = records
                     self._active = True
@@ -2134,26 +2283,36 @@ class MasterDetailDataset(MasterDataSet):
             else:
                 return
         else:
+            self._prefetch_details = prefetch_details
             return super(MasterDetailDataset, self).open(expanded,
                 fields, where, order_by, open_empty, params, offset, limit,
                 funcs, group_by)
 
-    def open__in(self, ids, expanded=None, fields=None, where=None, order_by=None, open_empty=False, params=None, offset=None, limit=None):
-
-        def slice_ids(ids):
-            MAX_IN_LIST = 999
-            result = []
-            while True:
-                result.append(ids[0:MAX_IN_LIST])
-                ids = ids[MAX_IN_LIST:]
-                if len(ids) == 0:
-                    break;
-            return result
-
+    def prefetch_records(self, ids):
         params = {}
-        for args, value in iteritems(locals()):
-            if not args in ['self', 'ids', 'params', 'slice_ids']:
-                params[args] = value
+        saved = self._open_params, self._where_list, self._order_by_list
+        try:
+            self._do_before_open(self.expanded, None, None, None, False, params,
+                None, None, None, None)
+        finally:
+            self._open_params, self._where_list, self._order_by_list = saved
+        self._bind_fields(self.expanded)
+        master_rec_id_field = getattr(self, '_master_rec_id_field', None)
+        if not self._master_rec_id or not master_rec_id_field in self.fields:
+            return
+        params['__master_id'] = self.master.ID
+        params['__master_rec_id'] = ids
+        result = self.do_internal_open(params)
+        rows, error_mes = result[0], result[1]
+        if error_mes:
+            raise RuntimeError(error_mes)
+        records = {}
+        index = master_rec_id_field.bind_index
+        for row in rows:
+            records.setdefault(row[index], []).append(row)
+        return records
+
+    def open__in(self, ids, expanded=None, fields=None, where=None, order_by=None, open_empty=False, params=None, offset=None, limit=None):
         if type(ids) == dict:
             keys = list(iterkeys(ids))
             id_field_name = keys[0]
@@ -2162,26 +2321,13 @@ class MasterDetailDataset(MasterDataSet):
             id_field_name = 'id'
         else:
             raise Exception('Item %s: invalid ids parameter in open__in method' % self.item_name)
-        if params['where'] is None:
-            params['where'] = {}
-        on_after_open = self.on_after_open
-        self.on_after_open = None
-        on_filters_applied = self.on_filters_applied
-        self.on_filters_applied = None
-        records = []
-        lst = slice_ids(ids)
-        for l in lst:
-            params['where'][id_field_name + '__in'] = l
-            self.open(**params)
-            records += self._dataset
-        self._dataset = records
-        self.first()
-        self.on_after_open = on_after_open
-        self.on_filters_applied = on_filters_applied
-        self._do_after_open()
-        self.update_controls(common.UPDATE_OPEN)
-        if self.on_filters_applied:
-            self.on_filters_applied(self)
+        if where is None:
+            where = {}
+        else:
+            where = dict(where)
+        where[id_field_name + '__in'] = ids
+        self.open(expanded=expanded, fields=fields, where=where, order_by=order_by,
+            open_empty=open_empty, params=params, offset=offset, limit=limit)
 
     def insert(self):
         if self.master and not self.master.is_changing():
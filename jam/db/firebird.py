@@ -12,6 +12,10 @@ CAN_CHANGE_TYPE = False
 CAN_CHANGE_SIZE = False
 DDL_ROLLBACK = True
 NEED_GENERATOR = True
+SINGLE_WRITER = False
+CI_PREFIX_RANGE = False
+COUNT_OVER = False
+PREPARED_STATEMENTS = False
 
 FROM = '"%s" AS %s'
 LEFT_OUTER_JOIN = 'LEFT OUTER JOIN "%s" AS %s'
@@ -63,24 +67,66 @@ def process_sql_params(params, cursor):
         result.append(value)
     return result
 
-def process_sql_result(rows):
+def process_sql_result(rows, description=None):
     result = []
     for row in rows:
         result.append(list(row))
     return result
 
+def get_converters(data_types):
+    return []
+
 def cast_date(date_str):
     return "CAST('" + date_str + "' AS DATE)"
 
 def cast_datetime(datetime_str):
     return "CAST('" + datetime_str + "' AS TIMESTAMP)"
 
+def datetime_param(value):
+    return value
+
 def value_literal(index):
     return '?'
 
 def upper_function():
     return 'UPPER'
 
+def explain_sql(sql):
+    pass
+
+def in_list_sql(field_sql, data_type, values, params, setup):
+    pass
+
+def approx_count_sql(table_name):
+    pass
+
+def ci_index_field(field_name):
+    return '"%s"' % field_name
+
+def change_fts_sql(table_name, primary_key, old_fields, new_fields):
+    pass
+
+def delete_fts_sql(table_name):
+    pass
+
+def fts_sync_sql(table_name, fields):
+    pass
+
+def fts_query(field_name, words):
+    pass
+
+def fts_condition(table_name, table_alias, primary_key, field_name, value):
+    pass
+
+def fts_rank(table_name, table_alias, primary_key, field_name, value):
+    pass
+
+def prepare_statement(cursor, name, command):
+    pass
+
+def deallocate_statement(cursor, name):
+    pass
+
 def create_table_sql(table_name, fields, gen_name=None, foreign_fields=None):
     result = []
     primary_key = ''
@@ -172,6 +218,14 @@ def next_sequence_value_sql(gen_name):
 def restart_sequence_sql(gen_name, value):
     return 'ALTER SEQUENCE %s RESTART WITH %d' % (gen_name, value)
 
+def next_sequence_values(cursor, gen_name, count):
+    cursor.execute('SELECT GEN_ID("%s", %d) FROM RDB$DATABASE' % (gen_name, count))
+    last = cursor.fetchone()[0]
+    return list(range(last - count + 1, last + 1))
+
+def execute_many(cursor, command, params):
+    cursor.executemany(command, params)
+
 def set_literal_case(name):
     return name.upper()
 
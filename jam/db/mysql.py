@@ -1,3 +1,4 @@
+import re
 import MySQLdb
 from werkzeug._compat import iteritems
 
@@ -12,6 +13,10 @@ CAN_CHANGE_TYPE = False
 CAN_CHANGE_SIZE = False
 DDL_ROLLBACK = False
 NEED_GENERATOR = False
+SINGLE_WRITER = False
+CI_PREFIX_RANGE = False
+COUNT_OVER = False
+PREPARED_STATEMENTS = False
 
 FROM = '"%s" AS %s'
 LEFT_OUTER_JOIN = 'LEFT OUTER JOIN "%s" AS %s'
@@ -69,24 +74,91 @@ def process_sql_params(params, cursor):
         result.append(value)
     return result
 
-def process_sql_result(rows):
+def process_sql_result(rows, description=None):
     result = []
     for row in rows:
         result.append(list(row))
     return result
 
+def get_converters(data_types):
+    return []
+
 def cast_date(date_str):
     return "'" + date_str + "'"
 
 def cast_datetime(datetime_str):
     return "'" + datetime_str + "'"
 
+def datetime_param(value):
+    return value
+
 def value_literal(index):
     return '%s'
 
 def upper_function():
     pass
 
+def explain_sql(sql):
+    return 'EXPLAIN %s' % sql
+
+def in_list_sql(field_sql, data_type, values, params, setup):
+    index = 1
+    while 'DELETE FROM "JAM_IN_%d_%d"' % (data_type, index) in setup:
+        index += 1
+    table_name = 'JAM_IN_%d_%d' % (data_type, index)
+    field_type = FIELD_TYPES[data_type]
+    if data_type == TEXT:
+        field_type += '(1024)'
+    setup.append('CREATE TEMPORARY TABLE IF NOT EXISTS "%s" ("V" %s)' % (table_name, field_type))
+    setup.append('DELETE FROM "%s"' % table_name)
+    for i in range(0, len(values), 1000):
+        chunk = values[i:i + 1000]
+        setup.append(('INSERT INTO "%s" ("V") VALUES %s' % (table_name,
+            ', '.join(['(%s)'] * len(chunk))), chunk))
+    return '%s IN (SELECT "V" FROM "%s")' % (field_sql, table_name)
+
+def approx_count_sql(table_name):
+    return "SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '%s'" % table_name
+
+def ci_index_field(field_name):
+    return '"%s"' % field_name
+
+def change_fts_sql(table_name, primary_key, old_fields, new_fields):
+    result = []
+    for field in old_fields:
+        if not field in new_fields:
+            result.append('DROP INDEX "%s_FTS_%s" ON "%s"' % (table_name, field, table_name))
+    for field in new_fields:
+        if not field in old_fields:
+            result.append('CREATE FULLTEXT INDEX "%s_FTS_%s" ON "%s" ("%s")' % \
+                (table_name, field, table_name, field))
+    return result
+
+def delete_fts_sql(table_name):
+    pass
+
+def fts_sync_sql(table_name, fields):
+    pass
+
+def fts_query(field_name, words):
+    lexemes = []
+    for word in words:
+        lexemes += re.findall(r'\w+', word, re.UNICODE)
+    if lexemes:
+        return ' '.join(['+%s*' % lexeme for lexeme in lexemes])
+
+def fts_condition(table_name, table_alias, primary_key, field_name, value):
+    return 'MATCH (%s."%s") AGAINST (%s IN BOOLEAN MODE)' % (table_alias, field_name, value)
+
+def fts_rank(table_name, table_alias, primary_key, field_name, value):
+    return 'MATCH (%s."%s") AGAINST (%s IN BOOLEAN MODE) DESC' % (table_alias, field_name, value)
+
+def prepare_statement(cursor, name, command):
+    pass
+
+def deallocate_statement(cursor, name):
+    pass
+
 def create_table_sql(table_name, fields, gen_name=None, foreign_fields=None):
     result = []
     primary_key = ''
@@ -185,6 +257,12 @@ def next_sequence_value_sql(table_name):
 def restart_sequence_sql(table_name, value):
     pass
 
+def next_sequence_values(cursor, table_name, count):
+    pass
+
+def execute_many(cursor, command, params):
+    cursor.executemany(command, params)
+
 def set_literal_case(name):
     return name.lower()
 
@@ -1,5 +1,8 @@
 import sys
 import cx_Oracle
+import datetime
+
+LOB_TYPES = (cx_Oracle.BLOB, cx_Oracle.CLOB, cx_Oracle.NCLOB)
 
 DATABASE = 'ORACLE'
 NEED_DATABASE_NAME = True
@@ -12,6 +15,10 @@ CAN_CHANGE_TYPE = False
 CAN_CHANGE_SIZE = False
 DDL_ROLLBACK = False
 NEED_GENERATOR = True
+SINGLE_WRITER = False
+CI_PREFIX_RANGE = False
+COUNT_OVER = True
+PREPARED_STATEMENTS = False
 
 FROM = '"%s" %s '
 LEFT_OUTER_JOIN = 'LEFT OUTER JOIN "%s" %s'
@@ -63,6 +70,8 @@ def get_select(query, start, end, fields):
     result = 'SELECT %s FROM %s' % (start, end)
     if limit:
         flds = get_fields(query, fields, 'b')
+        if query.get('__count_over'):
+            flds += ', b."JAM_COUNT"'
         rnum = offset + 1
         rownum = offset + limit
         if offset == 0:
@@ -87,29 +96,81 @@ def process_sql_params(params, cursor):
         result.append(value)
     return result
 
-def process_sql_result(rows):
+def process_sql_result(rows, description=None):
+    if description is None:
+        columns = None
+    else:
+        columns = [i for i, column in enumerate(description) if column[1] in LOB_TYPES]
+        if not columns:
+            return [list(row) for row in rows]
     result = []
     for row in rows:
-        fields = []
-        for field in row:
-            if isinstance(field, cx_Oracle.LOB):
-                field = field.read()
-            fields.append(field)
-        result.append(fields)
+        row = list(row)
+        for i in columns or range(len(row)):
+            if isinstance(row[i], cx_Oracle.LOB):
+                row[i] = row[i].read()
+        result.append(row)
     return result
 
+def convert_date(value):
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    return value
+
+def get_converters(data_types):
+    return [(i, convert_date) for i, data_type in enumerate(data_types) if data_type == DATE]
+
 def cast_date(date_str):
     return "TO_DATE('" + date_str + "', 'YYYY-MM-DD')"
 
 def cast_datetime(datetime_str):
     return "TO_DATE('" + date_str + "', 'YYYY-MM-DD  HH24:MI')"
 
+def datetime_param(value):
+    return value
+
 def value_literal(index):
     return ':f%d' % index
 
 def upper_function():
     return 'UPPER'
 
+def explain_sql(sql):
+    pass
+
+def in_list_sql(field_sql, data_type, values, params, setup):
+    pass
+
+def approx_count_sql(table_name):
+    return "SELECT NUM_ROWS FROM USER_TABLES WHERE TABLE_NAME = '%s'" % table_name
+
+def ci_index_field(field_name):
+    return '"%s"' % field_name
+
+def change_fts_sql(table_name, primary_key, old_fields, new_fields):
+    pass
+
+def delete_fts_sql(table_name):
+    pass
+
+def fts_sync_sql(table_name, fields):
+    pass
+
+def fts_query(field_name, words):
+    pass
+
+def fts_condition(table_name, table_alias, primary_key, field_name, value):
+    pass
+
+def fts_rank(table_name, table_alias, primary_key, field_name, value):
+    pass
+
+def prepare_statement(cursor, name, command):
+    pass
+
+def deallocate_statement(cursor, name):
+    pass
+
 def create_table_sql(table_name, fields, gen_name=None, foreign_fields=None):
     result = []
     primary_key = ''
@@ -207,6 +268,18 @@ def restart_sequence_sql(gen_name, value):
     result.append('CREATE SEQUENCE "%s" START WITH %s' % (gen_name, value))
     return result
 
+def next_sequence_values(cursor, gen_name, count):
+    cursor.execute('SELECT "%s".NEXTVAL FROM DUAL CONNECT BY LEVEL <= %d' % (gen_name, count))
+    return [row[0] for row in cursor.fetchall()]
+
+def execute_many(cursor, command, params):
+    blobs = [p for p in params if [v for v in p if isinstance(v, cx_Oracle.Variable)]]
+    if blobs:
+        for p in params:
+            cursor.execute(command, p)
+    else:
+        cursor.executemany(command, params)
+
 def set_literal_case(name):
     return name.upper()
 
@@ -1,5 +1,15 @@
+import re
 import psycopg2
-from werkzeug._compat import iteritems
+try:
+    from psycopg2.extras import execute_batch
+except ImportError:
+    execute_batch = None
+from werkzeug._compat import iteritems, to_unicode
+
+try:
+    BINARY_TYPES = (buffer, memoryview)
+except NameError:
+    BINARY_TYPES = (memoryview,)
 
 psycopg2.extensions.register_type(psycopg2.extensions.UNICODE)
 
@@ -14,6 +24,11 @@ CAN_CHANGE_TYPE = False
 CAN_CHANGE_SIZE = False
 DDL_ROLLBACK = True
 NEED_GENERATOR = True
+SINGLE_WRITER = False
+CI_PREFIX_RANGE = False
+COUNT_OVER = True
+PREPARED_STATEMENTS = True
+FTS_CONFIG = 'simple'
 
 FROM = '"%s" AS %s'
 LEFT_OUTER_JOIN = 'LEFT OUTER JOIN "%s" AS %s'
@@ -61,29 +76,118 @@ def process_sql_params(params, cursor):
         result.append(value)
     return result
 
-def process_sql_result(rows):
+def process_sql_result(rows, description=None):
+    if description is None:
+        columns = None
+    else:
+        columns = [i for i, column in enumerate(description) if column[1] == psycopg2.BINARY]
+        if not columns:
+            return [list(row) for row in rows]
     result = []
     for row in rows:
-        fields = []
-        for field in row:
-            if type(field) == buffer:
-                field = str(field)
-            fields.append(field)
-        result.append(fields)
+        row = list(row)
+        for i in columns or range(len(row)):
+            if isinstance(row[i], BINARY_TYPES):
+                row[i] = bytes(row[i])
+        result.append(row)
     return result
 
+def convert_keys(value):
+    if isinstance(value, bytes):
+        value = to_unicode(value, 'utf-8')
+    return value
+
+def get_converters(data_types):
+    return [(i, convert_keys) for i, data_type in enumerate(data_types) if data_type == KEYS]
+
 def cast_date(date_str):
     return "CAST('" + date_str + "' AS DATE)"
 
 def cast_datetime(datetime_str):
     return "CAST('" + datetime_str + "' AS TIMESTAMP)"
 
+def datetime_param(value):
+    return value
+
 def value_literal(index):
     return '%s'
 
 def upper_function():
     pass
 
+def explain_sql(sql):
+    return 'EXPLAIN %s' % sql
+
+def in_list_sql(field_sql, data_type, values, params, setup):
+    params.append(values)
+    return '(%s = ANY(%s))' % (field_sql, value_literal(len(params)))
+
+def approx_count_sql(table_name):
+    return "SELECT CAST(reltuples AS BIGINT) FROM pg_class WHERE relname = '%s'" % table_name
+
+def ci_index_field(field_name):
+    return '"%s" varchar_pattern_ops' % field_name
+
+def fts_vector(field_name):
+    return "to_tsvector('%s', COALESCE(%s, ''))" % (FTS_CONFIG, field_name)
+
+def change_fts_sql(table_name, primary_key, old_fields, new_fields):
+    result = []
+    for field in old_fields:
+        if not field in new_fields:
+            result.append('DROP INDEX IF EXISTS "%s_FTS_%s"' % (table_name, field))
+    for field in new_fields:
+        if not field in old_fields:
+            result.append('CREATE INDEX "%s_FTS_%s" ON "%s" USING GIN (%s)' % \
+                (table_name, field, table_name, fts_vector('"%s"' % field)))
+    return result
+
+def delete_fts_sql(table_name):
+    pass
+
+def fts_sync_sql(table_name, fields):
+    pass
+
+def fts_query(field_name, words):
+    lexemes = []
+    for word in words:
+        lexemes += re.findall(r'\w+', word, re.UNICODE)
+    if lexemes:
+        return ' & '.join(['%s:*' % lexeme for lexeme in lexemes])
+
+def fts_condition(table_name, table_alias, primary_key, field_name, value):
+    return "%s @@ to_tsquery('%s', %s)" % \
+        (fts_vector('%s."%s"' % (table_alias, field_name)), FTS_CONFIG, value)
+
+def fts_rank(table_name, table_alias, primary_key, field_name, value):
+    return "ts_rank(%s, to_tsquery('%s', %s)) DESC" % \
+        (fts_vector('%s."%s"' % (table_alias, field_name)), FTS_CONFIG, value)
+
+def prepare_statement(cursor, name, command):
+    parts = command.split('%%')
+    count = 0
+    for i, part in enumerate(parts):
+        pieces = part.split('%s')
+        part = pieces[0]
+        for piece in pieces[1:]:
+            count += 1
+            part += '$%d' % count + piece
+        parts[i] = part
+    cursor.execute('SAVEPOINT JAM_PREPARE')
+    try:
+        cursor.execute('PREPARE %s AS %s' % (name, '%'.join(parts)))
+    except psycopg2.Error:
+        cursor.execute('ROLLBACK TO SAVEPOINT JAM_PREPARE')
+        return
+    cursor.execute('RELEASE SAVEPOINT JAM_PREPARE')
+    if count:
+        return name, 'EXECUTE %s (%s)' % (name, ', '.join(['%s'] * count))
+    else:
+        return name, 'EXECUTE %s' % name
+
+def deallocate_statement(cursor, name):
+    cursor.execute('DEALLOCATE %s' % name)
+
 def create_table_sql(table_name, fields, gen_name=None, foreign_fields=None):
     result = []
     primary_key = ''
@@ -177,6 +281,16 @@ def next_sequence_value_sql(gen_name):
 def restart_sequence_sql(gen_name, value):
     return 'ALTER SEQUENCE "%s" RESTART WITH %d' % (gen_name, value)
 
+def next_sequence_values(cursor, gen_name, count):
+    cursor.execute("SELECT NEXTVAL('%s') FROM GENERATE_SERIES(1, %d)" % (gen_name, count))
+    return [row[0] for row in cursor.fetchall()]
+
+def execute_many(cursor, command, params):
+    if execute_batch:
+        execute_batch(cursor, command, params)
+    else:
+        cursor.executemany(command, params)
+
 def set_literal_case(name):
     return name.lower()
 
@@ -1,4 +1,6 @@
 import sqlite3
+import datetime
+from werkzeug._compat import string_types
 
 DATABASE = 'SQLITE'
 NEED_DATABASE_NAME = True
@@ -11,6 +13,24 @@ CAN_CHANGE_TYPE = False
 CAN_CHANGE_SIZE = True
 DDL_ROLLBACK = False
 NEED_GENERATOR = False
+SINGLE_WRITER = True
+CI_PREFIX_RANGE = True
+COUNT_OVER = sqlite3.sqlite_version_info >= (3, 25, 0)
+PREPARED_STATEMENTS = False
+
+PRAGMAS = [
+    ('busy_timeout', 5000)
+]
+
+WAL_PRAGMAS = [
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+    ('mmap_size', 268435456),
+    ('cache_size', -16000),
+    ('temp_store', 'MEMORY')
+]
+
+WAL_DATABASES = set()
 
 FROM = '"%s" AS %s'
 LEFT_OUTER_JOIN = 'OUTER LEFT JOIN "%s" AS %s'
@@ -42,12 +62,26 @@ def sqlite_upper(value_):
     except:
         pass
 
+def create_function(connection, name, func):
+    try:
+        connection.create_function(name, 1, func, deterministic=True)
+    except (TypeError, sqlite3.NotSupportedError):
+        connection.create_function(name, 1, func)
+
 def connect(database, user, password, host, port, encoding):
-    connection = sqlite3.connect(database)
-    connection.create_function("LOWER", 1, sqlite_lower)
-    connection.create_function("UPPER", 1, sqlite_upper)
+    connection = sqlite3.connect(database, check_same_thread=False)
+    create_function(connection, "LOWER", sqlite_lower)
+    create_function(connection, "UPPER", sqlite_upper)
     cursor = connection.cursor()
     cursor.execute("PRAGMA foreign_keys = ON")
+    pragmas = PRAGMAS
+    if database in WAL_DATABASES:
+        pragmas = PRAGMAS + WAL_PRAGMAS
+    for pragma, value in pragmas:
+        try:
+            cursor.execute("PRAGMA %s = %s" % (pragma, value))
+        except sqlite3.Error as e:
+            print('SQLite PRAGMA %s error: %s' % (pragma, e))
     return connection
 
 def get_lastrowid(cursor):
@@ -71,21 +105,117 @@ def process_sql_params(params, cursor):
         result.append(value)
     return result
 
-def process_sql_result(rows):
+def process_sql_result(rows, description=None):
     return [list(row) for row in rows]
 
+def convert_date(value):
+    if isinstance(value, string_types):
+        value = value.split(' ')[0].split('T')[0]
+        return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+    return value
+
+def convert_datetime(value):
+    if isinstance(value, string_types):
+        value = value.split('.')[0].replace('T', ' ')
+        if len(value) == 10:
+            value += ' 00:00:00'
+        elif len(value) == 16:
+            value += ':00'
+        return datetime.datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    return value
+
+def get_converters(data_types):
+    result = []
+    for i, data_type in enumerate(data_types):
+        if data_type == DATE:
+            result.append((i, convert_date))
+        elif data_type == DATETIME:
+            result.append((i, convert_datetime))
+    return result
+
 def cast_date(date_str):
     return "'%s'" % date_str
 
 def cast_datetime(datetime_str):
     return "'%s'" % datetime_str
 
+def datetime_param(value):
+    return value.strftime('%Y-%m-%d %H:%M')
+
 def value_literal(index):
     return '?'
 
 def upper_function():
     pass
 
+def explain_sql(sql):
+    return 'EXPLAIN QUERY PLAN %s' % sql
+
+def in_list_sql(field_sql, data_type, values, params, setup):
+    index = 1
+    while 'DELETE FROM "JAM_IN_%d_%d"' % (data_type, index) in setup:
+        index += 1
+    table_name = 'JAM_IN_%d_%d' % (data_type, index)
+    setup.append('CREATE TEMP TABLE IF NOT EXISTS "%s" ("V")' % table_name)
+    setup.append('DELETE FROM "%s"' % table_name)
+    for i in range(0, len(values), 500):
+        chunk = values[i:i + 500]
+        setup.append(('INSERT INTO "%s" ("V") VALUES %s' % (table_name,
+            ', '.join(['(?)'] * len(chunk))), chunk))
+    return '%s IN (SELECT "V" FROM "%s")' % (field_sql, table_name)
+
+def approx_count_sql(table_name):
+    pass
+
+def ci_index_field(field_name):
+    return '"%s"' % field_name
+
+def fts_table_name(table_name):
+    return '%s_FTS' % table_name
+
+def change_fts_sql(table_name, primary_key, old_fields, new_fields):
+    result = []
+    if old_fields != new_fields:
+        fts_table = fts_table_name(table_name)
+        if old_fields:
+            result.append('DROP TABLE IF EXISTS "%s"' % fts_table)
+        if new_fields:
+            field_list = ', '.join(['"%s"' % field for field in new_fields])
+            result.append('CREATE VIRTUAL TABLE "%s" USING fts5(%s)' % (fts_table, field_list))
+            result.append('INSERT INTO "%s" (rowid, %s) SELECT "%s", %s FROM "%s"' % \
+                (fts_table, field_list, primary_key, field_list, table_name))
+    return result
+
+def delete_fts_sql(table_name):
+    return 'DROP TABLE IF EXISTS "%s"' % fts_table_name(table_name)
+
+def fts_sync_sql(table_name, fields):
+    fts_table = fts_table_name(table_name)
+    return ('DELETE FROM "%s" WHERE rowid = ?' % fts_table,
+        'INSERT INTO "%s" (rowid, %s) VALUES (?, %s)' % (fts_table,
+        ', '.join(['"%s"' % field for field in fields]), ', '.join(['?' for field in fields])))
+
+def fts_query(field_name, words):
+    words = ['"%s"*' % word.replace('"', '""') for word in words]
+    if words:
+        return '{"%s"} : (%s)' % (field_name, ' '.join(words))
+
+def fts_condition(table_name, table_alias, primary_key, field_name, value):
+    fts_table = fts_table_name(table_name)
+    return '%s."%s" IN (SELECT rowid FROM "%s" WHERE "%s" MATCH %s)' % \
+        (table_alias, primary_key, fts_table, fts_table, value)
+
+def fts_rank(table_name, table_alias, primary_key, field_name, value):
+    fts_table = fts_table_name(table_name)
+    return '(SELECT rank FROM "%s" WHERE "%s" MATCH %s AND rowid = %s."%s")' % \
+        (fts_table, fts_table, value, table_alias, primary_key)
+
+def prepare_statement(cursor, name, command):
+    pass
+
+def deallocate_statement(cursor, name):
+    pass
+
 def create_table_sql(table_name, fields, gen_name=None, foreign_fields=None):
     result = []
     primary_key = ''
@@ -151,6 +281,12 @@ def next_sequence_value_sql(table_name):
 def restart_sequence_sql(table_name, value):
     pass
 
+def next_sequence_values(cursor, table_name, count):
+    pass
+
+def execute_many(cursor, command, params):
+    cursor.executemany(command, params)
+
 def set_literal_case(name):
     return name.upper()
 
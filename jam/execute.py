@@ -1,19 +1,37 @@
 import sys, os
 import datetime
+import time
+import threading
+import traceback
+import json
+import logging
+import sqlite3
+from logging.handlers import RotatingFileHandler
+from collections import deque, OrderedDict
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 
+import jam
 import jam.common as common
 import jam.db.db_modules as db_modules
-from werkzeug._compat import string_types
+from werkzeug._compat import string_types, iteritems
 
-def execute_select(cursor, db_module, command):
+def execute_select(cursor, db_module, command, params=None, statements=None):
 #    print('')
 #    print(command)
     try:
-        cursor.execute(command)
+        if statements and params is not None:
+            statements.execute(cursor, command, params)
+        elif params is not None:
+            cursor.execute(command, params)
+        else:
+            cursor.execute(command)
     except Exception as x:
-        print ('\nError: %s\n command: %s' % (str(x), command))
+        print ('\nError: %s\n command: %s\n params: %s' % (str(x), command, params))
         raise
-    return db_module.process_sql_result(cursor.fetchall())
+    return db_module.process_sql_result(cursor.fetchall(), cursor.description)
 
 def execute(cursor, command, params):
 #    print('')
@@ -50,59 +68,148 @@ def execute_dll(cursor, db_module, command, params, messages):
             if db_module.DDL_ROLLBACK:
                 raise
 
-def execute_command(cursor, db_module, command, params=None, select=False, ddl=False, messages=None):
+def execute_command(cursor, db_module, command, params=None, select=False, ddl=False, messages=None, statements=None):
     if select:
-        result = execute_select(cursor, db_module, command)
+        result = execute_select(cursor, db_module, command, params, statements)
     elif ddl:
         result = execute_dll(cursor, db_module, command, params, messages)
+    elif statements and params:
+        result = statements.execute(cursor, command, params)
     else:
         result = execute(cursor, command, params)
     return result
 
+def process_delta_record(cursor, db_module, sql, master_rec_id, changes, rec_id=None):
+    (command, params, info, h_sql, h_params, h_gen_name), details = sql
+    if info:
+        rec_id = info['primary_key']
+        if info['inserted']:
+            if info['master_rec_id_index']:
+                params[info['master_rec_id_index']] = master_rec_id
+            if not rec_id:
+                next_sequence_value_sql = db_module.next_sequence_value_sql(info['gen_name'])
+                if next_sequence_value_sql:
+                    cursor.execute(next_sequence_value_sql)
+                    rec = cursor.fetchone()
+                    rec_id = rec[0]
+                    params[info['primary_key_index']] = rec_id
+        if params:
+            params = db_module.process_sql_params(params, cursor)
+        if command:
+            execute(cursor, command, params)
+        if info['inserted'] and not rec_id:
+            rec_id = db_module.get_lastrowid(cursor)
+        if info.get('fts') and rec_id:
+            sync_fts(cursor, db_module, info['fts'], rec_id)
+        result_details = []
+        if rec_id:
+            changes.append({'log_id': info['log_id'], 'rec_id': rec_id, 'details': result_details})
+        for detail in details:
+            result_detail = {}
+            result_details.append(result_detail)
+            process_delta(cursor, db_module, detail, rec_id, result_detail)
+    elif command:
+            execute(cursor, command, params)
+    if h_sql:
+        next_sequence_value_sql = db_module.next_sequence_value_sql(h_gen_name)
+        if next_sequence_value_sql and not h_params[0]:
+            cursor.execute(next_sequence_value_sql)
+            rec = cursor.fetchone()
+            h_params[0] = rec[0]
+        if not h_params[2]:
+            h_params[2] = rec_id
+        h_params = db_module.process_sql_params(h_params, cursor)
+        execute(cursor, h_sql, h_params)
+    return rec_id
+
+def sync_fts(cursor, db_module, fts, rec_id):
+    delete_sql, insert_sql, values = fts
+    execute(cursor, delete_sql, db_module.process_sql_params([rec_id], cursor))
+    if insert_sql:
+        execute(cursor, insert_sql, db_module.process_sql_params([rec_id] + values, cursor))
+
+def can_execute_many(db_module, sql):
+    (command, params, info, h_sql, h_params, h_gen_name), details = sql
+    if info and command and params and not info.get('fts'):
+        for detail_id, detail_sqls in details:
+            if detail_sqls:
+                return False
+        if info['inserted'] and not info['primary_key']:
+            return bool(db_module.next_sequence_value_sql(info['gen_name']))
+        return True
+    return False
+
+def process_delta_batch(cursor, db_module, batch, master_rec_id, changes):
+    (command, params, info, h_sql, h_params, h_gen_name), details = batch[0]
+    if info['inserted']:
+        no_id = [sql[0][1] for sql in batch if not sql[0][2]['primary_key']]
+        if no_id:
+            ids = db_module.next_sequence_values(cursor, info['gen_name'], len(no_id))
+            for params, rec_id in zip(no_id, ids):
+                params[info['primary_key_index']] = rec_id
+    rows = []
+    rec_ids = []
+    history = []
+    for (command, params, info, h_sql, h_params, h_gen_name), details in batch:
+        if info['inserted']:
+            if info['master_rec_id_index']:
+                params[info['master_rec_id_index']] = master_rec_id
+            rec_id = params[info['primary_key_index']]
+            if type(rec_id) == tuple:
+                rec_id = rec_id[0]
+        else:
+            rec_id = info['primary_key']
+        rec_ids.append(rec_id)
+        rows.append(db_module.process_sql_params(params, cursor))
+        if h_sql:
+            if not h_params[2]:
+                h_params[2] = rec_id
+            history.append((h_sql, h_params, h_gen_name))
+    try:
+        db_module.execute_many(cursor, command, rows)
+    except Exception as x:
+        print ('\nError: %s\n command: %s\n params: %s' % (str(x), command, rows))
+        raise
+    for ((command, params, info, h_sql, h_params, h_gen_name), details), rec_id in zip(batch, rec_ids):
+        result_details = []
+        if rec_id:
+            changes.append({'log_id': info['log_id'], 'rec_id': rec_id, 'details': result_details})
+        for detail in details:
+            result_detail = {}
+            result_details.append(result_detail)
+            process_delta(cursor, db_module, detail, rec_id, result_detail)
+    if history:
+        h_sql, h_params, h_gen_name = history[0]
+        no_id = [h[1] for h in history if not h[1][0]]
+        if no_id and db_module.next_sequence_value_sql(h_gen_name):
+            ids = db_module.next_sequence_values(cursor, h_gen_name, len(no_id))
+            for h_params, h_id in zip(no_id, ids):
+                h_params[0] = h_id
+        db_module.execute_many(cursor, h_sql,
+            [db_module.process_sql_params(h[1], cursor) for h in history])
+    return rec_ids[-1]
+
 def process_delta(cursor, db_module, delta, master_rec_id, result):
     ID, sqls = delta
     result['ID'] = ID
     changes = []
     result['changes'] = changes
-    for sql in sqls:
-        (command, params, info, h_sql, h_params, h_gen_name), details = sql
-        if info:
-            rec_id = info['primary_key']
-            if info['inserted']:
-                if info['master_rec_id_index']:
-                    params[info['master_rec_id_index']] = master_rec_id
-                if not rec_id:
-                    next_sequence_value_sql = db_module.next_sequence_value_sql(info['gen_name'])
-                    if next_sequence_value_sql:
-                        cursor.execute(next_sequence_value_sql)
-                        rec = cursor.fetchone()
-                        rec_id = rec[0]
-                        params[info['primary_key_index']] = rec_id
-            if params:
-                params = db_module.process_sql_params(params, cursor)
-            if command:
-                execute(cursor, command, params)
-            if info['inserted'] and not rec_id:
-                rec_id = db_module.get_lastrowid(cursor)
-            result_details = []
-            if rec_id:
-                changes.append({'log_id': info['log_id'], 'rec_id': rec_id, 'details': result_details})
-            for detail in details:
-                result_detail = {}
-                result_details.append(result_detail)
-                process_delta(cursor, db_module, detail, rec_id, result_detail)
-        elif command:
-                execute(cursor, command, params)
-        if h_sql:
-            next_sequence_value_sql = db_module.next_sequence_value_sql(h_gen_name)
-            if next_sequence_value_sql:
-                cursor.execute(next_sequence_value_sql)
-                rec = cursor.fetchone()
-                h_params[0] = rec[0]
-            if not h_params[2]:
-                h_params[2] = rec_id
-            h_params = db_module.process_sql_params(h_params, cursor)
-            execute(cursor, h_sql, h_params)
+    rec_id = None
+    batch = []
+    for sql in sqls + [None]:
+        if batch and (sql is None or not can_execute_many(db_module, sql) or \
+            sql[0][0] != batch[0][0][0] or sql[0][2]['inserted'] != batch[0][0][2]['inserted']):
+            if len(batch) == 1:
+                rec_id = process_delta_record(cursor, db_module, batch[0], master_rec_id, changes, rec_id)
+            else:
+                rec_id = process_delta_batch(cursor, db_module, batch, master_rec_id, changes)
+            batch = []
+        if sql is None:
+            break
+        if can_execute_many(db_module, sql):
+            batch.append(sql)
+        else:
+            rec_id = process_delta_record(cursor, db_module, sql, master_rec_id, changes, rec_id)
 
 def execute_delta(cursor, db_module, command, params, delta_result):
     delta = command['delta']
@@ -110,16 +217,18 @@ def execute_delta(cursor, db_module, command, params, delta_result):
 
 def execute_list(cursor, db_module, command, delta_result, params, select, ddl, messages):
     res = None
-    for com in command:
+    last = len(command) - 1
+    for i, com in enumerate(command):
         command_type = type(com)
+        com_select = select and i == last
         if command_type in string_types:
-            res = execute_command(cursor, db_module, com, params, select, ddl, messages)
+            res = execute_command(cursor, db_module, com, params, com_select, ddl, messages)
         elif command_type == dict:
             res = execute_delta(cursor, db_module, com, params, delta_result)
         elif command_type == list:
-            res = execute_list(cursor, db_module, com, delta_result, params, select, ddl, messages)
+            res = execute_list(cursor, db_module, com, delta_result, params, com_select, ddl, messages)
         elif command_type == tuple:
-            res = execute_command(cursor, db_module, com[0], com[1], select, ddl, messages)
+            res = execute_command(cursor, db_module, com[0], com[1], com_select, ddl, messages)
         elif not com:
             pass
         else:
@@ -128,7 +237,7 @@ def execute_list(cursor, db_module, command, delta_result, params, select, ddl,
 
 def execute_sql(db_module, db_database, db_user, db_password,
     db_host, db_port, db_encoding, connection, command,
-    params=None, call_proc=False, select=False, ddl=False):
+    params=None, call_proc=False, select=False, ddl=False, statements=None):
 
     if connection is None:
         try:
@@ -152,7 +261,7 @@ def execute_sql(db_module, db_database, db_user, db_password,
         else:
             command_type = type(command)
             if command_type in string_types:
-                result = execute_command(cursor, db_module, command, params, select, ddl, messages)
+                result = execute_command(cursor, db_module, command, params, select, ddl, messages, statements)
             elif command_type == dict:
                 res = execute_delta(cursor, db_module, command, params, delta_result)
             elif command_type == list:
@@ -189,30 +298,431 @@ def execute_sql(db_module, db_database, db_user, db_password,
 
     return connection, (result, error)
 
-def process_request(parentPID, name, queue, db_type, db_database, db_user, db_password, db_host, db_port, db_encoding, mod_count):
+def process_request(parentPID, name, pipe, db_type, db_database, db_user, db_password, db_host, db_port, db_encoding, mod_count):
     con = None
+    statements = None
     counter = 0
     db_module = db_modules.get_db_module(db_type)
     while True:
         if parentPID and hasattr(os, 'getppid') and os.getppid() != parentPID:
             break
-        request = queue.get()
-        if request:
-            result_queue = request['queue']
-            command = request['command']
-            params = request['params']
-            call_proc = request['call_proc']
-            select = request['select']
-            cur_mod_count = request['mod_count']
-            if cur_mod_count != mod_count or counter > 1000:
-                if con:
-                    con.rollback()
-                    con.close()
-                con = None
-                mod_count = cur_mod_count
-                counter = 0
-            con, result = execute_sql(db_module, db_database, db_user, db_password,
-                db_host, db_port, db_encoding, con, command, params, call_proc, select)
-            counter += 1
-            result_queue.put(result)
+        try:
+            if not pipe.poll(1):
+                continue
+            request = pickle.loads(pipe.recv_bytes())
+        except (EOFError, IOError):
+            break
+        command, params, call_proc, select, cur_mod_count = request
+        if cur_mod_count != mod_count or counter > 1000:
+            if con:
+                con.rollback()
+                con.close()
+            con = None
+            mod_count = cur_mod_count
+            counter = 0
+        if con is None and db_module.PREPARED_STATEMENTS:
+            statements = StatementCache(db_module)
+        con, result = execute_sql(db_module, db_database, db_user, db_password,
+            db_host, db_port, db_encoding, con, command, params, call_proc,
+            select, statements=statements)
+        counter += 1
+        try:
+            data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        except Exception as x:
+            data = pickle.dumps((None, 'Result pickling error: %s' % x), pickle.HIGHEST_PROTOCOL)
+        pipe.send_bytes(data)
+
+
+class StatementCache(object):
+    def __init__(self, db_module, size=100, prepare_after=3):
+        self.db_module = db_module
+        self.size = size
+        self.prepare_after = prepare_after
+        self.statements = OrderedDict()
+        self.seen = OrderedDict()
+        self.counter = 0
+        self.hits = 0
+        self.misses = 0
+
+    def execute(self, cursor, command, params):
+        statement = None
+        if command in self.statements:
+            statement = self.statements.pop(command)
+            self.statements[command] = statement
+            if statement:
+                self.hits += 1
+            else:
+                self.misses += 1
+        else:
+            self.misses += 1
+            if self.count(command) >= self.prepare_after:
+                statement = self.prepare(cursor, command)
+        if statement:
+            name, command = statement
+        cursor.execute(command, params)
+
+    def count(self, command):
+        result = self.seen.pop(command, 0) + 1
+        if result < self.prepare_after:
+            self.seen[command] = result
+            if len(self.seen) > self.size:
+                self.seen.popitem(last=False)
+        return result
+
+    def prepare(self, cursor, command):
+        if len(self.statements) >= self.size:
+            old_command, old_statement = self.statements.popitem(last=False)
+            if old_statement:
+                self.db_module.deallocate_statement(cursor, old_statement[0])
+        self.counter += 1
+        result = self.db_module.prepare_statement(cursor, 'JAM_STMT_%d' % self.counter, command)
+        self.statements[command] = result
+        return result
+
+class ConnectionPoolTimeout(Exception):
+    pass
+
+class PooledConnection(object):
+    def __init__(self, mod_count):
+        self.connection = None
+        self.mod_count = mod_count
+        self.counter = 0
+        self.released = time.time()
+        self.statements = None
+
+class ConnectionPool(object):
+    def __init__(self, db_module, db_database, db_user, db_password, db_host,
+        db_port, db_encoding, max_size=4, min_size=1, timeout=None, idle_timeout=300,
+        statement_cache_size=100, tracer=None):
+        self.db_module = db_module
+        self.db_database = db_database
+        self.db_user = db_user
+        self.db_password = db_password
+        self.db_host = db_host
+        self.db_port = db_port
+        self.db_encoding = db_encoding
+        self.max_size = max(max_size, 1)
+        self.min_size = min(max(min_size, 0), self.max_size)
+        self.timeout = timeout or None
+        self.idle_timeout = idle_timeout
+        self.statement_cache_size = statement_cache_size
+        self.tracer = tracer
+        self._entries = []
+        self._lock = threading.Lock()
+        self._idle = []
+        self._waiters = deque()
+        self._size = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.wait_time = 0
+        self.connects = 0
+
+    def checkout(self, mod_count=0, timeout=None):
+        if timeout is None:
+            timeout = self.timeout
+        with self._lock:
+            self.checkouts += 1
+            if self._idle and not self._waiters:
+                return self._idle.pop()
+            if self._size < self.max_size:
+                self._size += 1
+                pooled = PooledConnection(mod_count)
+                self._entries.append(pooled)
+                return pooled
+            waiter = [threading.Event(), None]
+            self._waiters.append(waiter)
+            self.waits += 1
+        started = time.time()
+        waiter[0].wait(timeout)
+        with self._lock:
+            self.wait_time += time.time() - started
+            if waiter[1] is None:
+                self._waiters.remove(waiter)
+                self.timeouts += 1
+                raise ConnectionPoolTimeout('Connection pool timeout: no free connection in %s seconds' % timeout)
+            return waiter[1]
+
+    def checkin(self, pooled):
+        with self._lock:
+            pooled.released = time.time()
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter[1] = pooled
+                waiter[0].set()
+            else:
+                self._idle.append(pooled)
+                self._close_idle(pooled.released)
+
+    def _close_idle(self, now):
+        opened = [p for p in self._idle if p.connection]
+        for pooled in opened[:len(opened) - self.min_size]:
+            if now - pooled.released > self.idle_timeout:
+                self.close_connection(pooled)
+
+    def close_connection(self, pooled):
+        if pooled.connection:
+            try:
+                pooled.connection.rollback()
+                pooled.connection.close()
+            except:
+                pass
+        pooled.connection = None
+        pooled.counter = 0
+        pooled.statements = None
+
+    def execute(self, command, params=None, call_proc=False, select=False, mod_count=0):
+        tracer = self.tracer
+        if tracer:
+            started = time.time()
+            result, wait = self._execute(command, params, call_proc, select, mod_count)
+            explain = None
+            if select:
+                explain = lambda command, params: self.explain_select(command, params, mod_count)
+            tracer.trace(command, params, result[0], result[1], time.time() - started,
+                wait, explain=explain)
+            return result
+        return self._execute(command, params, call_proc, select, mod_count)[0]
+
+    def _execute(self, command, params=None, call_proc=False, select=False,
+        mod_count=0, prepare=True):
+        started = time.time()
+        try:
+            pooled = self.checkout(mod_count)
+        except ConnectionPoolTimeout as e:
+            return (None, str(e)), time.time() - started
+        wait = time.time() - started
+        try:
+            if pooled.mod_count != mod_count or pooled.counter > 1000:
+                self.close_connection(pooled)
+                pooled.mod_count = mod_count
+            if pooled.connection is None:
+                self.connects += 1
+                if self.statement_cache_size and self.db_module.PREPARED_STATEMENTS:
+                    pooled.statements = StatementCache(self.db_module, self.statement_cache_size)
+            statements = None
+            if prepare:
+                statements = pooled.statements
+            pooled.connection, result = execute_sql(self.db_module, self.db_database,
+                self.db_user, self.db_password, self.db_host, self.db_port,
+                self.db_encoding, pooled.connection, command, params, call_proc,
+                select, statements=statements)
+            if pooled.connection is None:
+                pooled.statements = None
+            pooled.counter += 1
+        finally:
+            self.checkin(pooled)
+        return result, wait
+
+    def explain_select(self, command, params=None, mod_count=0):
+        if type(command) == list:
+            return
+        sql = self.db_module.explain_sql(command)
+        if sql:
+            (result, error), wait = self._execute(sql, params, select=True,
+                mod_count=mod_count, prepare=False)
+            if error:
+                return error
+            return '\n'.join([' '.join([str(v) for v in row]) for row in result])
+
+    def select_stream(self, command, params=None, mod_count=0, batch_size=1000):
+        started = time.time()
+        pooled = self.checkout(mod_count)
+        wait = time.time() - started
+        rows_count = 0
+        try:
+            if pooled.mod_count != mod_count or pooled.counter > 1000:
+                self.close_connection(pooled)
+                pooled.mod_count = mod_count
+            if pooled.connection is None:
+                self.connects += 1
+                pooled.connection = self.db_module.connect(self.db_database, self.db_user,
+                    self.db_password, self.db_host, self.db_port, self.db_encoding)
+            pooled.counter += 1
+            try:
+                cursor = pooled.connection.cursor()
+                if params is not None:
+                    cursor.execute(command, params)
+                else:
+                    cursor.execute(command)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    rows_count += len(rows)
+                    yield self.db_module.process_sql_result(rows, cursor.description)
+                pooled.connection.rollback()
+            except:
+                self.close_connection(pooled)
+                raise
+        finally:
+            self.checkin(pooled)
+            if self.tracer:
+                self.tracer.trace(command, params, None, None, time.time() - started,
+                    wait, rows=rows_count)
+
+    def get_stats(self):
+        with self._lock:
+            result = {
+                'max_size': self.max_size,
+                'min_size': self.min_size,
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'waiting': len(self._waiters),
+                'checkouts': self.checkouts,
+                'waits': self.waits,
+                'timeouts': self.timeouts,
+                'wait_time': self.wait_time,
+                'connects': self.connects
+            }
+            if self.db_module.PREPARED_STATEMENTS:
+                statements = [p.statements for p in self._entries if p.statements]
+                result['statement_hits'] = sum([s.hits for s in statements])
+                result['statement_misses'] = sum([s.misses for s in statements])
+            return result
+
+def get_api_context():
+    context = getattr(jam, 'context', None)
+    try:
+        return context.api
+    except:
+        return None, None
+
+def command_text(command):
+    command_type = type(command)
+    if command_type in string_types:
+        return command
+    elif command_type == tuple:
+        return command_text(command[0])
+    elif command_type == dict:
+        return 'DELTA %s' % command['delta'][0]
+    elif command_type == list:
+        return '; '.join([command_text(com) for com in command if com])
+    return str(command)
+
+class SQLLogSink(object):
+    def __init__(self, file_name, max_bytes=10485760, backup_count=5):
+        self.logger = logging.getLogger('jam.sql.%s' % file_name)
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            self.logger.addHandler(RotatingFileHandler(file_name,
+                maxBytes=max_bytes, backupCount=backup_count))
+
+    def write(self, record):
+        self.logger.info(json.dumps(record, default=common.json_defaul_handler))
+
+class SQLiteSink(object):
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.lock = threading.Lock()
+        self.write_records("""CREATE TABLE IF NOT EXISTS JAM_SLOW_SQL (
+            ID INTEGER PRIMARY KEY, LOGGED TEXT, ITEM_NAME TEXT, METHOD TEXT,
+            DURATION REAL, POOL_WAIT REAL, ROWS_COUNT INTEGER, BYTES INTEGER,
+            SQL_TEXT TEXT, PARAMS TEXT, ERROR TEXT, PLAN TEXT)""")
+
+    def write_records(self, command, params=None):
+        with self.lock:
+            connection = sqlite3.connect(self.file_name)
+            try:
+                if params:
+                    connection.execute(command, params)
+                else:
+                    connection.execute(command)
+                connection.commit()
+            finally:
+                connection.close()
+
+    def write(self, record):
+        self.write_records("""INSERT INTO JAM_SLOW_SQL (LOGGED, ITEM_NAME, METHOD,
+            DURATION, POOL_WAIT, ROWS_COUNT, BYTES, SQL_TEXT, PARAMS, ERROR, PLAN)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""", (record['logged'],
+            record['item'], record['method'], record['duration'], record['wait'],
+            record['rows'], record['bytes'], record['sql'], record['params'],
+            record['error'], record.get('plan')))
+
+class SQLTracer(object):
+    def __init__(self, threshold=1.0, explain=False, log_file=None, db_file=None,
+        max_bytes=10485760, backup_count=5, size=1000, measure_bytes=False):
+        self.threshold = threshold
+        self.explain = explain
+        self.measure_bytes = measure_bytes
+        self.records = deque(maxlen=size)
+        self.stats = {}
+        self.lock = threading.Lock()
+        self.sinks = []
+        if log_file:
+            self.sinks.append(SQLLogSink(log_file, max_bytes, backup_count))
+        if db_file:
+            self.sinks.append(SQLiteSink(db_file))
+
+    def result_size(self, result):
+        if self.measure_bytes:
+            try:
+                return len(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+            except:
+                pass
+
+    def trace(self, command, params, result, error, duration, wait=0, size=None,
+        rows=None, explain=None):
+        item_name, method = get_api_context()
+        if rows is None and type(result) == list:
+            rows = len(result)
+        if size is None and result is not None and duration >= self.threshold:
+            size = self.result_size(result)
+        record = {
+            'logged': datetime.datetime.now(),
+            'item': item_name,
+            'method': method,
+            'duration': duration,
+            'wait': wait,
+            'rows': rows,
+            'bytes': size,
+            'sql': command_text(command),
+            'params': None,
+            'error': error
+        }
+        if params and type(command) in string_types:
+            record['params'] = repr(params)[:1000]
+        with self.lock:
+            self.records.append(record)
+            stat = self.stats.get((item_name, method))
+            if stat is None:
+                stat = {'count': 0, 'duration': 0, 'max_duration': 0, 'wait': 0,
+                    'rows': 0, 'bytes': 0, 'slow': 0}
+                self.stats[(item_name, method)] = stat
+            stat['count'] += 1
+            stat['duration'] += duration
+            stat['max_duration'] = max(stat['max_duration'], duration)
+            stat['wait'] += wait
+            stat['rows'] += rows or 0
+            stat['bytes'] += size or 0
+            if duration >= self.threshold:
+                stat['slow'] += 1
+        if duration >= self.threshold:
+            if self.explain and explain and not error and type(command) in string_types:
+                try:
+                    record['plan'] = explain(command, params)
+                except Exception as e:
+                    record['plan'] = 'EXPLAIN error: %s' % e
+            for sink in self.sinks:
+                try:
+                    sink.write(record)
+                except Exception as e:
+                    print('SQL trace sink error: %s' % e)
+
+    def get_stats(self):
+        with self.lock:
+            result = []
+            for (item_name, method), stat in iteritems(self.stats):
+                stat = dict(stat)
+                stat['item'] = item_name
+                stat['method'] = method
+                result.append(stat)
+            result.sort(key=lambda s: s['duration'], reverse=True)
+            return result
 
+    def slow_records(self):
+        with self.lock:
+            return [r for r in self.records if r['duration'] >= self.threshold]
@@ -177,6 +177,7 @@ class AbstrTask(AbstractItem):
         self.history_item = None
         self.log = None
         self.languages = langs.get_langs()
+        self._items_index = (None, {}, {})
 
     def write_info(self, info):
         super(AbstrTask, self).write_info(info)
@@ -188,7 +189,41 @@ class AbstrTask(AbstractItem):
         super(AbstrTask, self).set_info(info)
         self.bind_items()
 
+    def bind_items(self):
+        super(AbstrTask, self).bind_items()
+        self.index_items()
+
+    def index_items(self):
+        by_ID = {}
+        by_name = {}
+
+        def add_ID(item):
+            if not item.ID in by_ID:
+                by_ID[item.ID] = item
+            for child in item.items:
+                add_ID(child)
+
+        add_ID(self)
+        for group in self.items:
+            if not group.item_name in by_name:
+                by_name[group.item_name] = group
+            for item in group.items:
+                if not item.item_name in by_name:
+                    by_name[item.item_name] = item
+        self._items_index = (self.items, by_ID, by_name)
+
+    def item_by_ID(self, id_value):
+        if self._items_index[0] is self.items:
+            result = self._items_index[1].get(id_value)
+            if not result is None:
+                return result
+        return super(AbstrTask, self).item_by_ID(id_value)
+
     def item_by_name(self, item_name):
+        if self._items_index[0] is self.items:
+            result = self._items_index[2].get(item_name)
+            if not result is None:
+                return result
         for group in self.items:
             if group.item_name == item_name:
                 return group
@@ -278,6 +313,8 @@ class AbstrItem(AbstractItem):
     def bind_item(self):
         self.prepare_fields()
         self.prepare_filters()
+        for field in self._fields:
+            field.share_schema()
 
     def can_create(self):
         return self.check_operation('can_create')
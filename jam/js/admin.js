@@ -496,7 +496,7 @@ function Events0() { // admin
 				'f_name', 'f_item_name', 'f_table_name', 'f_gen_name', 'f_view_template', 'f_visible', 'f_soft_delete',
 				'f_virtual_table', 'f_js_external',
 				'f_primary_key', 'f_deleted_flag', 'f_master_id', 'f_master_rec_id',
-				'f_keep_history', 'f_edit_lock', 'sys_id'
+				'f_keep_history', 'f_edit_lock', 'sys_id', 'f_ci_search', 'f_fts', 'f_lookup_cache'
 			]});
 			resize_elements(task);
 		}
@@ -579,7 +579,7 @@ function Events0() { // admin
 	//		'f_mp_pool', 'f_persist_con', 'f_single_file_js', 'f_dynamic_js',
 			'f_mp_pool', 'f_persist_con', 'f_compressed_js', 'f_single_file_js', 'f_dynamic_js',
 	//	  'f_history_item', 'f_lock_item', 'f_timeout', 'f_ignore_change_ip', 'f_version'];
-			'f_timeout', 'f_ignore_change_ip', 'f_version'];
+			'f_read_replicas', 'f_timeout', 'f_ignore_change_ip', 'f_version'];
 		task.sys_params.edit_options.title = caption;
 		task.sys_params.edit_record();
 	}
@@ -1144,7 +1144,7 @@ function Events3() { // admin.catalogs.sys_items
 				}
 			}
 	//	fields = fields.concat(['f_visible', 'f_soft_delete', 'f_virtual_table', 'f_keep_history', 'f_js_external'])
-			fields = fields.concat(['f_visible', 'f_soft_delete', 'f_virtual_table', 'f_js_external'])
+			fields = fields.concat(['f_visible', 'f_soft_delete', 'f_virtual_table', 'f_js_external', 'f_ci_search', 'f_fts', 'f_lookup_cache'])
 		}
 		if (item.type_id.value === types.ITEMS_TYPE || item.type_id.value === types.TABLES_TYPE) {
 			item.fields_editor = true;
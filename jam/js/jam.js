@@ -3285,8 +3285,12 @@
                     where, order_by, open_empty, params, offset, limit, funcs, group_by);
                 this._bind_fields(expanded);
             }
+            if (offset === 0) {
+                this._total_records = undefined;
+            }
             if (this.paginate) {
                 params.__limit = this._limit;
+                params.__count = offset === 0;
             }
             this.change_log.prepare();
             this._dataset = [];
@@ -3337,6 +3341,9 @@
                 } else {
                     if (data[0]) {
                         rows = data[0];
+                        if (data[2] !== undefined) {
+                            this._total_records = data[2];
+                        }
 
                         len = rows.length;
                         this._dataset = rows;
@@ -3524,6 +3531,8 @@
             var self = this;
             if (this._open_params.__open_empty && callback) {
                 return 0;
+            } else if (this._total_records !== undefined && callback) {
+                callback.call(this, this._total_records);
             } else {
                 this.send_request('total_records', this._open_params, function(data) {
                     if (data && callback) {
@@ -3884,6 +3893,7 @@
                     }
                     throw err;
                 } else {
+                    this._total_records = undefined;
                     this.change_log.update(res)
                     if (this.on_after_apply) {
                         this.on_after_apply.call(this, this);
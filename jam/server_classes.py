@@ -4,6 +4,10 @@ try:
 except ImportError:
     import queue as Queue
 import multiprocessing
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 import threading
 import zipfile
 from xml.dom.minidom import parseString
@@ -13,16 +17,48 @@ import traceback
 import inspect
 import json
 
+import jam
 import jam.common as common
 import jam.db.db_modules as db_modules
 from jam.items import *
 from jam.dataset import *
 from jam.sql import *
-from jam.execute import process_request, execute_sql
+from jam.execute import process_request, execute_sql, ConnectionPool, SQLTracer
+from jam.cache import ResultCache, LookupCache
 from jam.third_party.six import exec_, print_
 from werkzeug._compat import iteritems, iterkeys, text_type, string_types, to_bytes
 
+def parse_dsn(dsn):
+    user = password = host = port = ''
+    database = dsn
+    if '@' in dsn:
+        login, database = dsn.rsplit('@', 1)
+        user, sep, password = login.partition(':')
+        if '/' in database:
+            host, database = database.split('/', 1)
+            host, sep, port = host.partition(':')
+    return database, user, password, host, port
+
+class BorrowedCopy(object):
+    def __init__(self, item, key):
+        self.item = item
+        self.key = key
+        self.copy = None
+        self.mod_count = None
+
+    def __enter__(self):
+        self.mod_count = self.item.task.mod_count
+        self.copy = self.item._take_pooled_copy(self.key, self.mod_count)
+        return self.copy
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.item._return_pooled_copy(self.key, self.copy, self.mod_count)
+        self.copy = None
+
 class ServerDataset(Dataset, SQL):
+    _copy_pool_lock = threading.Lock()
+
     def __init__(self, table_name='', soft_delete=True):
         Dataset.__init__(self)
         self.ID = None
@@ -36,6 +72,12 @@ class ServerDataset(Dataset, SQL):
         self.on_field_get_text = None
         self.soft_delete = soft_delete
         self.virtual_table = False
+        self.cache_timeout = None
+        self.ci_search = False
+        self.fts = False
+        self.approx_count = None
+        self.lookup_cache = False
+        self._copy_pool = None
 
     def copy(self, filters=True, details=True, handlers=True):
         if self.master:
@@ -48,6 +90,11 @@ class ServerDataset(Dataset, SQL):
         result.gen_name = self.gen_name
         result._order_by = self._order_by
         result.soft_delete = self.soft_delete
+        result.cache_timeout = self.cache_timeout
+        result.ci_search = self.ci_search
+        result.fts = self.fts
+        result.approx_count = self.approx_count
+        result.lookup_cache = self.lookup_cache
         result._primary_key = self._primary_key
         result._deleted_flag = self._deleted_flag
         result._master_id = self._master_id
@@ -58,6 +105,78 @@ class ServerDataset(Dataset, SQL):
         result._master_rec_id_db_field_name = self._master_rec_id_db_field_name
         return result
 
+    def borrow(self, filters=True, details=True, handlers=True):
+        return BorrowedCopy(self, (filters, details, handlers))
+
+    def _take_pooled_copy(self, key, mod_count):
+        with self._copy_pool_lock:
+            if self._copy_pool is None or self._copy_pool[0] != mod_count:
+                self._copy_pool = (mod_count, {})
+            copies = self._copy_pool[1].get(key)
+            if copies:
+                return copies.pop()
+        return self.copy(*key)
+
+    def _return_pooled_copy(self, key, copy, mod_count):
+        copy._reset_copy(self, key[2])
+        with self._copy_pool_lock:
+            if self._copy_pool and self._copy_pool[0] == mod_count:
+                copies = self._copy_pool[1].setdefault(key, [])
+                if len(copies) < self.task.copy_pool_size:
+                    copies.append(copy)
+
+    def _reset_copy(self, prototype, handlers):
+        self.close()
+        self._where_list = []
+        self._order_by_list = []
+        self._select_field_list = []
+        self._open_params = {}
+        self._state = common.STATE_INACTIVE
+        self._filtered = False
+        self.total_records = None
+        self.table_name = prototype.table_name
+        self.gen_name = prototype.gen_name
+        self._order_by = prototype._order_by
+        self.soft_delete = prototype.soft_delete
+        self.cache_timeout = prototype.cache_timeout
+        self.ci_search = prototype.ci_search
+        self.fts = prototype.fts
+        self.approx_count = prototype.approx_count
+        self.lookup_cache = prototype.lookup_cache
+        self.expanded = prototype.expanded
+        self.keep_history = prototype.keep_history
+        self.select_all = prototype.select_all
+        self.virtual_table = False
+        self.lock_on_edit = False
+        self.parent_read_only = True
+        self._read_only = False
+        self._log_changes = True
+        for field in self._fields:
+            if field._base_schema is not None:
+                field._schema = field._base_schema
+                field._shared = True
+            field.on_field_get_text_called = None
+        self._update_fields(None)
+        self.filters = DBList()
+        for filter_def in self.filter_defs:
+            self.filters.append(DBFilter(self, filter_def))
+        self.prepare_filters()
+        for name, value in list(self.__dict__.items()):
+            if name.startswith('on_') and callable(value):
+                setattr(self, name, None)
+        if handlers:
+            for func_name, func in self._events:
+                setattr(self, func_name, func)
+        if not self.master:
+            self.change_log.prepare()
+            self.details_active = False
+            self._prefetch_details = None
+            self._prefetched = {}
+        for detail in self.details:
+            prototype_detail = prototype.detail_by_ID(detail.ID)
+            detail.disabled = prototype_detail.disabled
+            detail._reset_copy(prototype_detail, handlers)
+
     def get_event(self, caption):
         return getattr(caption)
 
@@ -104,6 +223,8 @@ class ServerDataset(Dataset, SQL):
 
     def add_detail(self, table):
         detail = Detail(self, table.item_name, table.item_caption, table.table_name)
+        detail.ci_search = table.ci_search
+        detail.fts = table.fts
         self.details.append(detail)
         detail.owner = self
         detail.init_fields()
@@ -139,13 +260,31 @@ class ServerDataset(Dataset, SQL):
             result = self.on_count(self, params)
         elif result is None:
             error_mess = ''
-            count = 0
-            for sql in self.get_record_count_queries(params):
-                rows = self.task.execute_select(sql)
-                count += rows[0][0]
+            count = self.get_approx_count(params)
+            if count is None:
+                sql = self.get_record_count_command(params)
+                cache_key = self.get_cache_key([sql])
+                count = self.get_cached_result(cache_key)
+                if count is None:
+                    count = self.task.execute_select(sql)[0][0]
+                    self.set_cached_result(cache_key, count)
             result = count, error_mess
         return result
 
+    def get_approx_count(self, params):
+        if self.approx_count and not params['__filters'] and not params.get('__master_rec_id'):
+            sql = self.task.db_module.approx_count_sql(self.table_name)
+            if sql:
+                cache_key = self.get_cache_key([sql])
+                count = self.get_cached_result(cache_key)
+                if count is None:
+                    rows = self.task.execute_select(sql)
+                    if rows and not rows[0][0] is None:
+                        count = int(rows[0][0])
+                        self.set_cached_result(cache_key, count)
+                if not count is None and count >= self.approx_count:
+                    return count
+
     def select_records(self, params, safe=False):
         if safe and not self.can_view():
             raise Exception(self.task.lang['cant_view'] % self.item_caption)
@@ -158,27 +297,87 @@ class ServerDataset(Dataset, SQL):
             error_mes = ''
             limit = params['__limit']
             offset = params['__offset']
-            sqls = self.get_select_queries(params)
-            if len(sqls) == 1:
-                rows = self.task.execute_select(sqls[0])
+            if self.keyset_values(params):
+                offset = 0
+            count = None
+            with_count = params.get('__count')
+            if with_count:
+                count = self.get_approx_count(params)
+                if count is None and not self.count_over(params) and \
+                    (limit or offset or self.keyset_values(params)):
+                    count, error_mes = self.get_record_count(params)
+                if not count is None:
+                    params = dict(params)
+                    params['__count'] = False
+            count_over = self.count_over(params)
+            sql = self.get_select_command(params)
+            cache_key = self.get_cache_key([sql])
+            rows = self.get_cached_result(cache_key)
+            if rows is None:
+                rows = self.task.execute_select(sql)
+                converters = self.get_converters(params)
+                if converters:
+                    self.convert_rows(rows, converters)
+                lookups = self.get_cached_lookups(params)
+                if lookups:
+                    self.fill_cached_lookups(rows, lookups)
+                self.set_cached_result(cache_key, rows)
+            if count_over:
+                if rows:
+                    count = rows[0][-1]
+                    rows = [row[:-1] for row in rows]
+                elif offset:
+                    count, error_mes = self.get_record_count(params)
+                else:
+                    count = 0
+            elif with_count and count is None:
+                count = len(rows)
+            if with_count:
+                result = rows, error_mes, count
             else:
-                rows = []
-                cut = False
-                for sql in sqls:
-                    rows += self.task.execute_select(sql)
-                    if limit or offset:
-                        if len(rows) >= offset + limit:
-                            rows = rows[offset:offset + limit]
-                            cut = True
-                            break
-                if (limit or offset) and not cut:
-                    rows = rows[offset:offset + limit]
-            result = rows, error_mes
+                result = rows, error_mes
         return result
 
     def apply_delta(self, delta, safe=False):
         sql = delta.apply_sql(safe)
-        return self.task.execute(sql)
+        try:
+            return self.task.execute(sql)
+        finally:
+            self.task.clear_identity_cache()
+            tables = self.get_write_tables()
+            self.task.lookup_maps.invalidate(tables)
+            if self.task.result_cache:
+                self.task.result_cache.invalidate(tables)
+
+    def get_read_tables(self):
+        result = [self.table_name]
+        for field in self.fields:
+            for item in (field.lookup_item, field.lookup_item1, field.lookup_item2):
+                if item and item.table_name:
+                    result.append(item.table_name)
+        return result
+
+    def get_write_tables(self):
+        result = [self.table_name]
+        for detail in self.details:
+            result += detail.get_write_tables()
+        if self.task.history_item and self.task.history_item.table_name:
+            result.append(self.task.history_item.table_name)
+        return result
+
+    def get_cache_key(self, sqls):
+        cache = self.task.result_cache
+        if cache and self.cache_timeout is not None and self.table_name and \
+            not self.virtual_table:
+            return cache.get_key(self.get_read_tables(), sqls, self.task.mod_count)
+
+    def get_cached_result(self, key):
+        if key:
+            return self.task.result_cache.get(key)
+
+    def set_cached_result(self, key, result):
+        if key:
+            self.task.result_cache.set(key, result, self.cache_timeout)
 
     def apply_changes(self, data, safe):
         result = None
@@ -194,34 +393,75 @@ class ServerDataset(Dataset, SQL):
             result = self.apply_delta(delta, safe)
         return result
 
-    def update_deleted(self):
+    def select_records_stream(self, params, safe=False, batch_size=1000):
+        if safe and not self.can_view():
+            raise Exception(self.task.lang['cant_view'] % self.item_caption)
+        if self.task.on_open or self.on_open or params.get('__count'):
+            return
+        query = self.get_select_command(params)
+        if type(query) == list:
+            return
+        converters = self.get_converters(params)
+        lookups = self.get_cached_lookups(params)
+        sql, sql_params = query
+        rows = self.task.execute_select_stream(sql, sql_params, batch_size)
+        if rows is not None and (converters or lookups):
+            rows = self.convert_stream(rows, converters, lookups)
+        return rows
+
+    def convert_stream(self, rows, converters, lookups=None):
+        try:
+            for batch in rows:
+                batch = self.convert_rows(batch, converters)
+                if lookups:
+                    batch = self.fill_cached_lookups(batch, lookups)
+                yield batch
+        finally:
+            rows.close()
+
+    def update_deleted(self, details=None):
         if self._is_delta and len(self.details):
             rec_no = self.rec_no
+            updated = []
             try:
+                logs = {}
                 for it in self:
                     if it.rec_deleted():
-                        for detail in self.details:
-                            fields = []
-                            for field in detail.fields:
-                                fields.append(field.field_name)
-                            det = self.task.item_by_name(detail.item_name).copy()
-                            where = {
-                                det._master_id: self.ID,
-                                det._master_rec_id: self._primary_key_field.value
-                            }
-                            det.open(fields=fields, expanded=detail.expanded, where=where)#, order_by=[])
-                            it.edit()
-                            for d in det:
-                                detail.append()
-                                for field in detail.fields:
-                                    f = det.field_by_name(field.field_name)
-                                    field.set_value(f.value, f.lookup_value)
-                                detail.post()
-                            it.post()
-                            for d in detail:
-                                d.record_status = common.RECORD_DELETED
+                        logs[self._primary_key_field.value] = self.change_log.find_record_log()
+                if logs:
+                    for detail in self.details:
+                        if details is None or detail.item_name in details:
+                            self._update_deleted_detail(detail, logs)
+                            updated.append(detail)
             finally:
                 self.rec_no = rec_no
+            for detail in updated:
+                if detail.active:
+                    detail.open()
+
+    def _update_deleted_detail(self, detail, logs):
+        fields = [field.field_name for field in detail.fields]
+        det = self.task.item_by_name(detail.item_name).copy()
+        where = {det._master_rec_id + '__in': list(logs.keys())}
+        if det._master_id:
+            where[det._master_id] = self.ID
+        det.open(fields=fields, expanded=detail.expanded, where=where)
+        fields = [field.field_name for field in det.fields if not field.master_field]
+        index = det._master_rec_id_field.bind_index
+        for record_log in logs.values():
+            record_log['details'][str(detail.ID)] = {
+                'logs': {},
+                'records': [],
+                'fields': fields,
+                'expanded': detail.expanded
+            }
+        for row in det._dataset:
+            detail_log = logs[row[index]]['details'][str(detail.ID)]
+            change_id = str(len(detail_log['records']) + 1)
+            record = row[0:det._record_info_index]
+            record.append([common.RECORD_DELETED, {}, change_id])
+            detail_log['records'].append(record)
+            detail_log['logs'][change_id] = {'old_record': None, 'record': record, 'details': {}}
 
     def field_by_id(self, id_value, field_name):
         return self.get_field_by_id((id_value, field_name))
@@ -230,18 +470,60 @@ class ServerDataset(Dataset, SQL):
         id_value, fields = params
         if not (isinstance(fields, tuple) or isinstance(fields, list)):
             fields = [fields]
-        copy = self.copy()
-        copy.set_where(id=id_value)
-        copy.open(fields=fields)
-        if copy.record_count() == 1:
-            result = []
-            for field_name in fields:
-                result.append(copy.field_by_name(field_name).value)
+        result = self.field_values_by_ids([id_value], fields).get(id_value)
+        if result is not None:
             if len(fields) == 1:
                 return result[0]
             else:
                 return result
-        return
+
+    def _id_key(self, id_value):
+        data_type = self._field_by_name(self._primary_key).data_type
+        if isinstance(id_value, string_types) and data_type == common.INTEGER:
+            try:
+                return int(id_value)
+            except ValueError:
+                pass
+        elif data_type == common.TEXT and not isinstance(id_value, string_types):
+            return text_type(id_value)
+        return id_value
+
+    def field_values_by_ids(self, ids, fields):
+        if not (isinstance(fields, tuple) or isinstance(fields, list)):
+            fields = [fields]
+        cache = self.task.get_identity_cache(self)
+        if cache is None:
+            cache = {}
+        keys = dict((id_value, self._id_key(id_value)) for id_value in ids)
+        missing = set()
+        for key in keys.values():
+            values = cache.get(key, {})
+            if values is not None and not key in missing:
+                for field_name in fields:
+                    if not field_name in values:
+                        missing.add(key)
+                        break
+        if missing:
+            copy = self.copy(filters=False, details=False)
+            copy.open(fields=[self._primary_key] + [f for f in fields if f != self._primary_key],
+                where={self._primary_key + '__in': list(missing)})
+            found = set()
+            for c in copy:
+                key = c._primary_key_field.value
+                found.add(key)
+                values = cache.get(key) or {}
+                for field_name in fields:
+                    values[field_name] = c.field_by_name(field_name).value
+                cache[key] = values
+            for key in missing:
+                if not key in found:
+                    cache[key] = None
+        result = {}
+        for id_value in ids:
+            values = cache.get(keys[id_value])
+            if values is not None:
+                result[id_value] = [values[field_name] for field_name in fields]
+        return result
 
 class Item(AbstrItem, ServerDataset):
     def __init__(self, owner, name, caption, visible = True,
@@ -770,10 +1052,55 @@ class Consts(object):
         self.RECORD_DELETED = common.RECORD_DELETED
 
 
+class IdAllocator(object):
+    def __init__(self, task, block_size):
+        self.task = task
+        self.block_size = block_size
+        self.lock = threading.Lock()
+        self.blocks = {}
+        self.connection = None
+
+    def next_id(self, gen_name):
+        if not self.task.db_module.next_sequence_value_sql(gen_name):
+            return
+        with self.lock:
+            ids = self.blocks.get(gen_name)
+            if not ids:
+                ids = self.fetch_block(gen_name)
+                ids.reverse()
+                self.blocks[gen_name] = ids
+            return ids.pop()
+
+    def fetch_block(self, gen_name):
+        try:
+            if self.connection is None:
+                self.connection = self.task.create_connection()
+            cursor = self.connection.cursor()
+            ids = self.task.db_module.next_sequence_values(cursor, gen_name, self.block_size)
+            self.connection.commit()
+            return ids
+        except:
+            if self.connection:
+                try:
+                    self.connection.close()
+                except:
+                    pass
+            self.connection = None
+            raise
+
+    def reset(self, gen_name=None):
+        with self.lock:
+            if gen_name:
+                self.blocks.pop(gen_name, None)
+            else:
+                self.blocks = {}
+
+
 class AbstractServerTask(AbstrTask):
     def __init__(self, app, name, caption, js_filename, db_type,
         db_database = '', db_user = '', db_password = '', host='', port='',
-        encoding='', con_pool_size=1, mp_pool=False, persist_con=False):
+        encoding='', con_pool_size=1, mp_pool=False, persist_con=False,
+        con_pool_timeout=None, id_block_size=0, sqlite_wal=False, read_replicas=''):
         AbstrTask.__init__(self, None, None, None, None)
         self.app = app
         self.consts = Consts()
@@ -791,6 +1118,8 @@ class AbstractServerTask(AbstrTask):
         self.db_port = port
         self.db_encoding = encoding
         self.db_module = db_modules.get_db_module(self.db_type)
+        if sqlite_wal and self.db_type == db_modules.SQLITE:
+            self.db_module.WAL_DATABASES.add(self.db_database)
         self.on_before_request = None
         self.on_after_request = None
         self.on_open = None
@@ -802,15 +1131,29 @@ class AbstractServerTask(AbstrTask):
         self.modules = []
         self.conversion_lock = threading.Lock()
         self.con_pool_size = con_pool_size
+        self.con_pool_timeout = con_pool_timeout
         self.mp_pool = mp_pool
         self.persist_con = persist_con
         self.persist_con_busy = 0
+        self.read_pools = []
+        self.read_pool_index = 0
+        self.read_sticky_time = 5
+        self.last_writes = {}
+        self.last_write = None
+        self.id_allocator = None
+        self.result_cache = None
+        self.tracer = None
+        self.copy_pool_size = 8
+        self.lookup_maps = LookupCache()
+        if id_block_size > 1:
+            self.id_allocator = IdAllocator(self, id_block_size)
         if self.mp_pool:
             if self.persist_con:
                 self.create_connection_pool(1)
             self.create_mp_connection_pool(self.con_pool_size)
         else:
             self.create_connection_pool(self.con_pool_size)
+        self.add_read_replicas(read_replicas)
 
     def get_version(self):
         return common.SETTINGS['VERSION']
@@ -818,53 +1161,152 @@ class AbstractServerTask(AbstrTask):
     version = property (get_version)
 
     def create_connection_pool(self, con_count):
-        self.queue = Queue.Queue()
-        pid = None
-        for i in range(con_count):
-            p = threading.Thread(target=process_request, args=(pid, self.item_name,
-                self.queue, self.db_type, self.db_database, self.db_user,
-                self.db_password, self.db_host, self.db_port,
-                self.db_encoding, self.mod_count))
-            p.daemon = True
-            p.start()
+        single_writer = self.db_module.SINGLE_WRITER and not self.mp_pool
+        max_size = con_count
+        if single_writer:
+            max_size = 1
+        self.pool = ConnectionPool(self.db_module, self.db_database, self.db_user,
+            self.db_password, self.db_host, self.db_port, self.db_encoding,
+            max_size=max_size, timeout=self.con_pool_timeout, tracer=self.tracer)
+        if single_writer:
+            self.add_read_replica(self.db_database, self.db_user, self.db_password,
+                self.db_host, self.db_port, self.db_encoding, con_count)
 
     def create_mp_connection_pool(self, con_count):
-        self.mp_queue = multiprocessing.Queue()
-        self.mp_manager = multiprocessing.Manager()
-        pid = os.getpid()
+        self.mp_workers = Queue.Queue()
         for i in range(con_count):
-            p = multiprocessing.Process(target=process_request, args=(pid, self.item_name,
-                self.mp_queue, self.db_type, self.db_database, self.db_user,
-                self.db_password, self.db_host, self.db_port,
-                self.db_encoding, self.mod_count))
-            p.daemon = True
-            p.start()
+            self.mp_workers.put(self.create_mp_worker())
+
+    def create_mp_worker(self):
+        parent_pipe, child_pipe = multiprocessing.Pipe()
+        p = multiprocessing.Process(target=process_request, args=(os.getpid(),
+            self.item_name, child_pipe, self.db_type, self.db_database,
+            self.db_user, self.db_password, self.db_host, self.db_port,
+            self.db_encoding, self.mod_count))
+        p.daemon = True
+        p.start()
+        return p, parent_pipe
 
     def create_connection(self):
         return self.db_module.connect(self.db_database, self.db_user, self.db_password, self.db_host, self.db_port, self.db_encoding)
 
-    def send_to_pool(self, queue, result_queue, command, params=None, call_proc=False, select=False):
-        request = {}
-        request['queue'] = result_queue
-        request['command'] = command
-        request['params'] = params
-        request['call_proc'] = call_proc
-        request['select'] = select
-        request['mod_count'] = self.mod_count
-        queue.put(request)
-        return  result_queue.get()
+    def allocate_id(self, gen_name, db_module=None):
+        if self.id_allocator and gen_name and (db_module is None or db_module is self.db_module):
+            return self.id_allocator.next_id(gen_name)
+
+    def add_read_replica(self, db_database='', db_user='', db_password='',
+        host='', port='', encoding='', con_pool_size=None):
+        pool = ConnectionPool(self.db_module, db_database, db_user, db_password,
+            host, port, encoding, max_size=con_pool_size or self.con_pool_size,
+            timeout=self.con_pool_timeout, tracer=self.tracer)
+        self.read_pools.append(pool)
+        return pool
+
+    def add_read_replicas(self, dsns):
+        if dsns:
+            for dsn in dsns.split(','):
+                dsn = dsn.strip()
+                if dsn:
+                    database, user, password, host, port = parse_dsn(dsn)
+                    self.add_read_replica(database, user, password, host, port,
+                        self.db_encoding)
+
+    def session_key(self):
+        try:
+            return self.session['uuid']
+        except:
+            pass
+
+    def request_context(self):
+        context = getattr(jam, 'context', None)
+        if context is not None and hasattr(context, 'environ'):
+            return context
+
+    def register_write(self):
+        if self.read_pools:
+            now = time.time()
+            key = self.session_key()
+            context = self.request_context()
+            if key:
+                if len(self.last_writes) > 1000:
+                    self.last_writes = dict([(k, v) for k, v in iteritems(self.last_writes) \
+                        if now - v < self.read_sticky_time])
+                self.last_writes[key] = now
+            elif context:
+                context.last_write = now
+            else:
+                self.last_write = now
+
+    def last_write_time(self):
+        key = self.session_key()
+        if key:
+            return self.last_writes.get(key)
+        context = self.request_context()
+        if context:
+            return getattr(context, 'last_write', None)
+        return self.last_write
+
+    def get_read_pool(self):
+        if self.read_pools:
+            written = self.last_write_time()
+            if written and time.time() - written < self.read_sticky_time:
+                return
+            self.read_pool_index += 1
+            return self.read_pools[self.read_pool_index % len(self.read_pools)]
 
     def execute_in_pool(self, command, params=None, call_proc=False, select=False):
-        result_queue = Queue.Queue()
-        result = self.send_to_pool(self.queue, result_queue, command, params, call_proc, select)
+        return self.pool.execute(command, params, call_proc, select, self.mod_count)
+
+    def pool_stats(self):
+        result = self.pool.get_stats()
+        if self.read_pools:
+            result['replicas'] = [pool.get_stats() for pool in self.read_pools]
         return result
 
+    def set_sql_tracer(self, threshold=1.0, explain=False, log_file=None,
+        db_file=None, max_bytes=10485760, backup_count=5, measure_bytes=False):
+        self.tracer = SQLTracer(threshold, explain, log_file, db_file, max_bytes,
+            backup_count, measure_bytes=measure_bytes)
+        self.pool.tracer = self.tracer
+        for pool in self.read_pools:
+            pool.tracer = self.tracer
+        return self.tracer
+
     def execute_in_mp_poll(self, command, params=None, call_proc=False, select=False):
-        result_queue = self.mp_manager.Queue()
-        result = self.send_to_pool(self.mp_queue, result_queue, command, params, call_proc, select)
+        started = time.time()
+        worker = self.mp_workers.get()
+        wait = time.time() - started
+        size = None
+        try:
+            process, pipe = worker
+            pipe.send_bytes(pickle.dumps((command, params, call_proc, select,
+                self.mod_count), pickle.HIGHEST_PROTOCOL))
+            data = pipe.recv_bytes()
+            size = len(data)
+            result = pickle.loads(data)
+        except (EOFError, IOError) as e:
+            pipe.close()
+            if process.is_alive():
+                process.terminate()
+            worker = self.create_mp_worker()
+            result = None, 'Connection pool process error: %s' % e
+        finally:
+            self.mp_workers.put(worker)
+        if self.tracer:
+            explain = None
+            if select and self.persist_con:
+                explain = lambda command, params: self.pool.explain_select(command, params, self.mod_count)
+            self.tracer.trace(command, params, result[0], result[1], time.time() - started,
+                wait, size=size, explain=explain)
         return result
 
+    def set_result_cache(self, backend=None):
+        self.result_cache = ResultCache(backend)
+        return self.result_cache
+
     def execute(self, command, params=None, call_proc=False, select=False):
+        if not select:
+            self.register_write()
         if self.mp_pool:
             if self.persist_con and not self.persist_con_busy:
                 self.persist_con_busy += 1
@@ -876,6 +1318,17 @@ class AbstractServerTask(AbstrTask):
                 result = self.execute_in_mp_poll(command, params, call_proc, select)
         else:
             result = self.execute_in_pool(command, params, call_proc, select)
+        if not select:
+            self.clear_identity_cache()
+            if call_proc:
+                self.lookup_maps.clear()
+            else:
+                self.lookup_maps.invalidate_command(command)
+            if self.result_cache:
+                if call_proc:
+                    self.result_cache.clear()
+                else:
+                    self.result_cache.invalidate_command(command)
         return result
 
     def callproc(self, command, params=None):
@@ -883,13 +1336,57 @@ class AbstractServerTask(AbstrTask):
         if not error:
             return result_set
 
-    def execute_select(self, command, params=None):
-        result, error = self.execute(command, params, select=True)
+    def execute_select_stream(self, command, params=None, batch_size=1000):
+        pool = self.get_read_pool()
+        if pool is None and not self.mp_pool:
+            pool = self.pool
+        if pool:
+            return pool.select_stream(command, params, self.mod_count, batch_size)
+
+    def execute_select(self, command, params=None, primary=False):
+        pool = None
+        if not primary:
+            pool = self.get_read_pool()
+        return self._execute_select(pool, command, params)
+
+    def _execute_select(self, pool, command, params=None):
+        if type(command) == tuple:
+            command, params = command
+        if pool:
+            result, error = pool.execute(command, params, select=True, mod_count=self.mod_count)
+        else:
+            result, error = self.execute(command, params, select=True)
         if error:
             raise Exception(error)
         else:
             return result
 
+    def get_identity_cache(self, item):
+        context = getattr(jam, 'context', None)
+        if context is not None and hasattr(context, 'environ'):
+            try:
+                cache = context.identity_cache
+            except AttributeError:
+                cache = context.identity_cache = {}
+            return cache.setdefault((self.item_name, item.ID), {})
+
+    def clear_identity_cache(self):
+        context = getattr(jam, 'context', None)
+        if context is not None and hasattr(context, 'identity_cache'):
+            context.identity_cache = {}
+
+    def get_lookup_map(self, item, db_field_name):
+        generation = None
+        if self.result_cache:
+            generation = self.result_cache.generations([item.table_name])[0]
+        return self.lookup_maps.get(item.table_name, db_field_name,
+            lambda: self.load_lookup_map(item, db_field_name), generation)
+
+    def load_lookup_map(self, item, db_field_name):
+        rows = self.execute_select('SELECT "%s", "%s" FROM "%s"' % \
+            (item._primary_key_db_field_name, db_field_name, item.table_name))
+        return dict((row[0], row[1]) for row in rows)
+
     def get_module_name(self):
         return str(self.item_name)
 
@@ -962,11 +1459,11 @@ class AbstractServerTask(AbstrTask):
                         self.execute('DELETE FROM "%s"' % item.table_name)
                         item.open(expanded=False, open_empty=True)
                         params = {'__fields': [], '__filters': [], '__expanded': False, '__offset': 0, '__limit': 0}
-                        sql = item.get_record_count_query(params, db_module)
+                        sql, sql_params = item.get_record_count_command(params, db_module)
                         connection, (result, error) = \
                         execute_sql(db_module, database, user, password,
                             host, port, encoding, connection, sql,
-                            params=None, select=True)
+                            params=sql_params, select=True)
                         record_count = result[0][0]
                         loaded = 0
                         max_id = 0
@@ -974,11 +1471,11 @@ class AbstractServerTask(AbstrTask):
                             while True:
                                 params['__offset'] = loaded
                                 params['__limit'] = limit
-                                sql = item.get_select_statement(params, db_module)
+                                sql, sql_params = item.get_select_command(params, db_module)
                                 connection, (result, error) = \
                                 execute_sql(db_module, database, user, password,
                                     host, port, encoding, connection, sql,
-                                    params=None, select=True)
+                                    params=sql_params, select=True)
                                 if not error:
                                     for i, r in enumerate(result):
                                         item.append()
@@ -1001,6 +1498,8 @@ class AbstractServerTask(AbstrTask):
                             if item.gen_name:
                                 sql = self.db_module.restart_sequence_sql(item.gen_name, max_id + 1)
                                 self.execute(sql)
+                                if self.id_allocator:
+                                    self.id_allocator.reset(item.gen_name)
 
 class DebugException(Exception):
     pass
@@ -1010,10 +1509,12 @@ class Task(AbstractServerTask):
     def __init__(self, app, name, caption, js_filename,
         db_type, db_database = '', db_user = '', db_password = '',
         host='', port='', encoding='', con_pool_size=4, mp_pool=True,
-        persist_con=True):
+        persist_con=True, con_pool_timeout=None, id_block_size=0, sqlite_wal=False,
+        read_replicas=''):
         AbstractServerTask.__init__(self, app, name, caption, js_filename,
             db_type, db_database, db_user, db_password,
-            host, port, encoding, con_pool_size, mp_pool, persist_con)
+            host, port, encoding, con_pool_size, mp_pool, persist_con,
+            con_pool_timeout, id_block_size, sqlite_wal, read_replicas)
         self.on_created = None
         self.on_ext_request = None
         self.init_dict = {}
@@ -1090,18 +1591,35 @@ class Detail(AbstrDetail, ServerDataset):
     def do_internal_post(self):
         return {'success': True, 'id': None, 'message': '', 'detail_ids': None}
 
-    def where_clause(self, query, db_module):
+    def where_clause(self, query, db_module, params=None, seek=False, setup=None):
         master_id = query['__master_id']
         master_rec_id = query['__master_rec_id']
         if master_id and master_rec_id:
-            result = super(Detail, self).where_clause(query, db_module)
-            if self._master_id:
-                clause = '%s."%s"=%s AND %s."%s"=%s' % \
-                    (self.table_alias(), self._master_id_db_field_name, str(master_id),
-                    self.table_alias(), self._master_rec_id_db_field_name, str(master_rec_id))
+            result = super(Detail, self).where_clause(query, db_module, params, seek, setup)
+            if params is None:
+                master_id_literal = str(master_id)
+            elif self._master_id:
+                params.append(master_id)
+                master_id_literal = db_module.value_literal(len(params))
+            if type(master_rec_id) == list:
+                field = self._field_by_name(self._master_rec_id)
+                if len(master_rec_id) > MAX_IN_LIST:
+                    clause = self._get_in_list_condition(field, common.FILTER_IN,
+                        master_rec_id, db_module, params, setup)
+                else:
+                    clause = self._get_condition(field, common.FILTER_IN,
+                        master_rec_id, db_module, params)
             else:
+                if params is None:
+                    master_rec_id_literal = str(master_rec_id)
+                else:
+                    params.append(master_rec_id)
+                    master_rec_id_literal = db_module.value_literal(len(params))
                 clause = '%s."%s"=%s' % \
-                    (self.table_alias(), self._master_rec_id_db_field_name, str(master_rec_id))
+                    (self.table_alias(), self._master_rec_id_db_field_name, master_rec_id_literal)
+            if self._master_id:
+                clause = '%s."%s"=%s AND %s' % \
+                    (self.table_alias(), self._master_id_db_field_name, master_id_literal, clause)
             if result:
                 result += ' AND ' + clause
             else:
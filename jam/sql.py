@@ -1,20 +1,27 @@
 import sys
 import json
+import datetime
 import traceback
 
 import jam.common as common
 import jam.db.db_modules as db_modules
 from jam.dataset import *
-from werkzeug._compat import iteritems, text_type, string_types
+from jam.third_party.six import unichr
+from werkzeug._compat import iteritems, text_type, string_types, to_unicode
+
+MAX_IN_LIST = 1000
 
 class SQL(object):
 
     def get_next_id(self, db_module=None):
+        result = self.task.allocate_id(self.gen_name, db_module)
+        if result:
+            return result
         if db_module is None:
             db_module = self.task.db_module
         sql = db_module.next_sequence_value_sql(self.gen_name)
         if sql:
-            rec = self.task.execute_select(sql)
+            rec = self.task.execute_select(sql, primary=True)
             if rec:
                 if rec[0][0]:
                     return int(rec[0][0])
@@ -33,6 +40,11 @@ class SQL(object):
                 values.append('%s' % db_module.value_literal(index))
                 value = (field.raw_value, field.data_type)
                 row.append(value)
+        for field in self._ci_fields():
+            index += 1
+            fields.append('"%s"' % (field.db_field_name + common.CI_FIELD_SUFFIX))
+            values.append('%s' % db_module.value_literal(index))
+            row.append((self._ci_value(field.raw_value), common.TEXT))
         fields = ', '.join(fields)
         values = ', '.join(values)
         sql = 'INSERT INTO "%s" (%s) VALUES (%s)' % \
@@ -52,14 +64,48 @@ class SQL(object):
                 if field.field_name == self._deleted_flag:
                     value = (0, field.data_type)
                 row.append(value)
+        for field in self._ci_fields():
+            index += 1
+            fields.append('"%s"=%s' % (field.db_field_name + common.CI_FIELD_SUFFIX,
+                db_module.value_literal(index)))
+            row.append((self._ci_value(field.raw_value), common.TEXT))
         fields = ', '.join(fields)
-        if self._primary_key_field.data_type == common.TEXT:
-            id_literal = "'%s'" % self._primary_key_field.value
-        else:
-            id_literal = "%s" % self._primary_key_field.value
-        where = " WHERE %s = %s" % (self._primary_key_db_field_name, id_literal)
+        row.append((self._primary_key_field.value, self._primary_key_field.data_type))
+        where = " WHERE %s = %s" % (self._primary_key_db_field_name, db_module.value_literal(index + 1))
         return ''.join([command, fields, where]), row
 
+    def _is_search_field(self, field):
+        return field.data_type == common.TEXT and \
+            not (field.calculated or field.master_field or field.lookup_item) and \
+            field.field_name != self._primary_key
+
+    def _is_ci_field(self, field):
+        return self.ci_search and self._is_search_field(field)
+
+    def _ci_fields(self):
+        if self.ci_search:
+            return [field for field in self.fields if self._is_ci_field(field)]
+        return []
+
+    def _fts_fields(self):
+        if self.fts:
+            return [field for field in self.fields if self._is_search_field(field)]
+        return []
+
+    def _fts_sync_sql(self, db_module, deleted=False):
+        fields = self._fts_fields()
+        if fields:
+            sqls = db_module.fts_sync_sql(self.table_name, [field.db_field_name for field in fields])
+            if sqls:
+                delete_sql, insert_sql = sqls
+                if deleted:
+                    return delete_sql, None, None
+                return delete_sql, insert_sql, [field.raw_value for field in fields]
+
+    def _ci_value(self, value):
+        if value is not None:
+            return to_unicode(value, 'utf-8').upper()
+
     def delete_sql(self, db_module):
         soft_delete = self.soft_delete
         if self.master:
@@ -87,6 +133,10 @@ class SQL(object):
             if item.record_status == common.RECORD_INSERTED:
                 if safe and not self.can_create():
                     raise Exception(self.task.lang['cant_create'] % self.item_caption)
+                if not item._primary_key_field.value:
+                    rec_id = item.task.allocate_id(item.gen_name, db_module)
+                    if rec_id:
+                        item._primary_key_field.set_data(rec_id)
                 sql, param = item.insert_sql(db_module)
             elif item.record_status == common.RECORD_MODIFIED:
                 if safe and not self.can_edit():
@@ -116,6 +166,10 @@ class SQL(object):
                 'log_id': item.get_rec_info()[common.REC_CHANGE_ID],
                 'master_rec_id_index': master_rec_id_index
                 }
+            if item.record_status != common.RECORD_DETAILS_MODIFIED:
+                fts = item._fts_sync_sql(db_module, item.record_status == common.RECORD_DELETED)
+                if fts:
+                    info['fts'] = fts
             h_sql, h_params, h_gen_name = get_history_sql(item, db_module)
             return sql, param, info, h_sql, h_params, h_gen_name
 
@@ -205,7 +259,8 @@ class SQL(object):
                             for d in detail:
                                 d_list.append([d.ID, d._primary_key_field.value, d.record_status])
                     changes = (json.dumps([f_list, d_list], default=common.json_defaul_handler), common.BLOB)
-                h_params = [None, item.ID, item._primary_key_field.value, item.record_status, changes, user, datetime.datetime.now()]
+                h_id = item.task.allocate_id(h_gen_name, db_module)
+                h_params = [h_id, item.ID, item._primary_key_field.value, item.record_status, changes, user, datetime.datetime.now()]
                 if deleted_flag:
                     h_params.append(0)
             return h_sql, h_params, h_gen_name
@@ -267,9 +322,16 @@ class SQL(object):
                         field_sql = '%s(%s) AS "%s"' % (func.upper(), field_sql, field.db_field_name)
                 sql.append(field_sql)
         if query['__expanded']:
+            cached = self.cached_lookup_fields(query, fields)
             for field in fields:
                 if field.lookup_item:
-                    if field.lookup_field2:
+                    if field in cached:
+                        cur_field = field
+                        if field.master_field:
+                            cur_field = field.master_field
+                        field_sql = '%s."%s" %s %s_LOOKUP' % \
+                        (self.table_alias(), cur_field.db_field_name, db_module.FIELD_AS, field.db_field_name)
+                    elif field.lookup_field2:
                         field_sql = '%s."%s" %s %s_LOOKUP' % \
                         (self.lookup_table_alias2(field), field.lookup_db_field2, db_module.FIELD_AS, field.db_field_name)
                         #~ if funcs:
@@ -301,6 +363,44 @@ class SQL(object):
         sql = ', '.join(sql)
         return sql
 
+    def cached_lookup_fields(self, query, fields):
+        result = []
+        if query['__expanded'] and not query.get('__funcs') and not query.get('__group_by'):
+            searched = [field_name for (field_name, filter_type, value) in query.get('__filters', []) \
+                if filter_type in [common.FILTER_CONTAINS, common.FILTER_STARTWITH,
+                common.FILTER_ENDWITH, common.FILTER_CONTAINS_ALL]]
+            ordered = [order[0] for order in query.get('__order', [])]
+            for field in fields:
+                if field.lookup_item and field.lookup_item.lookup_cache and \
+                    not field.lookup_item1 and field.data_type != common.KEYS and \
+                    not field.field_name in searched and not field.ID in ordered:
+                    result.append(field)
+        return result
+
+    def get_cached_lookups(self, query):
+        result = []
+        field_list = query['__fields']
+        if len(field_list):
+            fields = [self._field_by_name(field_name) for field_name in field_list]
+        else:
+            fields = self._fields
+        cached = self.cached_lookup_fields(query, fields)
+        if cached:
+            index = len([field for field in fields if not field.master_field])
+            for field in fields:
+                if field.lookup_item:
+                    if field in cached:
+                        result.append((index, field))
+                    index += 1
+        return result
+
+    def fill_cached_lookups(self, rows, lookups):
+        for index, field in lookups:
+            values = self.task.get_lookup_map(field.lookup_item, field.lookup_db_field)
+            for row in rows:
+                row[index] = values.get(row[index])
+        return rows
+
     def from_clause(self, query, fields, db_module=None):
         if db_module is None:
             db_module = self.task.db_module
@@ -308,7 +408,10 @@ class SQL(object):
         result.append(db_module.FROM % (self.table_name, self.table_alias()))
         if query['__expanded']:
             joins = {}
+            cached = self.cached_lookup_fields(query, fields)
             for field in fields:
+                if field in cached:
+                    continue
                 if field.lookup_item and field.data_type != common.KEYS:
                     alias = self.lookup_table_alias(field)
                     cur_field = field
@@ -400,11 +503,35 @@ class SQL(object):
         else:
             return value
 
-    def _escape_search(self, value, esc_char):
+    def _bind_field_value(self, field, value, filter_type, db_module, params):
+        data_type = field.data_type
+        if data_type == common.BOOLEAN:
+            if value:
+                value = 1
+            else:
+                value = 0
+        elif data_type in (common.FLOAT, common.CURRENCY):
+            value = float(value)
+        elif type(value) in string_types:
+            if data_type == common.INTEGER and value.isdigit():
+                value = int(value)
+        elif data_type == common.DATE:
+            if isinstance(value, datetime.datetime):
+                value = value.date()
+        elif data_type == common.DATETIME:
+            if isinstance(value, datetime.datetime):
+                value = value.replace(second=0, microsecond=0)
+            else:
+                value = datetime.datetime(value.year, value.month, value.day)
+            value = db_module.datetime_param(value)
+        params.append(value)
+        return db_module.value_literal(len(params))
+
+    def _escape_search(self, value, esc_char, literal=True):
         result = ''
         found = False
         for ch in value:
-            if ch == "'":
+            if ch == "'" and literal:
                 ch = ch + ch
             elif ch in ['_', '%']:
                 ch = esc_char + ch
@@ -412,50 +539,69 @@ class SQL(object):
             result += ch
         return result, found
 
-    def _get_condition(self, field, filter_type, value, db_module):
+    def _get_condition(self, field, filter_type, value, db_module, params=None):
         esc_char = '/'
         cond_field_name = '%s."%s"' % (self.table_alias(), field.db_field_name)
         if type(value) == str:
             value = to_unicode(value, 'utf-8')
         filter_sign = self._get_filter_sign(filter_type, value, db_module)
         cond_string = '%s %s %s'
+        bool_false = field.data_type == common.BOOLEAN and not value
         if filter_type in (common.FILTER_IN, common.FILTER_NOT_IN):
             values = [self._convert_field_value(field, v, filter_type, db_module) for v in value]
             value = '(%s)' % ', '.join(values)
+            if params is not None and db_module.value_literal(1) == '%s':
+                value = value.replace('%', '%%')
         elif filter_type == common.FILTER_RANGE:
-            value = self._convert_field_value(field, value[0], filter_type, db_module) + \
-                ' AND ' + self._convert_field_value(field, value[1], filter_type, db_module)
+            if params is None:
+                value = self._convert_field_value(field, value[0], filter_type, db_module) + \
+                    ' AND ' + self._convert_field_value(field, value[1], filter_type, db_module)
+            else:
+                value = self._bind_field_value(field, value[0], filter_type, db_module, params) + \
+                    ' AND ' + self._bind_field_value(field, value[1], filter_type, db_module, params)
         elif filter_type == common.FILTER_ISNULL:
             value = ''
-        else:
+        elif filter_type in [common.FILTER_CONTAINS, common.FILTER_STARTWITH, common.FILTER_ENDWITH]:
             value = self._convert_field_value(field, value, filter_type, db_module)
-            if filter_type in [common.FILTER_CONTAINS, common.FILTER_STARTWITH, common.FILTER_ENDWITH]:
-                value, esc_found = self._escape_search(value, esc_char)
-                if field.lookup_item:
-                    if field.lookup_item1:
-                        cond_field_name = '%s."%s"' % (self.lookup_table_alias1(field), field.lookup_db_field1)
-                    else:
-                        if field.data_type == common.KEYS:
-                            cond_field_name = '%s."%s"' % (self.table_alias(), field.db_field_name)
-                        else:
-                            cond_field_name = '%s."%s"' % (self.lookup_table_alias(field), field.lookup_db_field)
-
-                if filter_type == common.FILTER_CONTAINS:
-                    value = '%' + value + '%'
-                elif filter_type == common.FILTER_STARTWITH:
-                    value = value + '%'
-                elif filter_type == common.FILTER_ENDWITH:
-                    value = '%' + value
-                upper_function =  db_module.upper_function()
-                if upper_function:
-                    cond_string = upper_function + '(%s) %s %s'
-                    value = value.upper()
-                if esc_found:
-                    value = "'" + value + "' ESCAPE '" + esc_char + "'"
+            if not type(value) in string_types:
+                value = text_type(value)
+            if self._is_ci_field(field):
+                return self._get_ci_condition(field, filter_type, value, db_module, params)
+            value, esc_found = self._escape_search(value, esc_char, params is None)
+            if field.lookup_item:
+                if field.lookup_item1:
+                    cond_field_name = '%s."%s"' % (self.lookup_table_alias1(field), field.lookup_db_field1)
                 else:
-                    value = "'" + value + "'"
+                    if field.data_type == common.KEYS:
+                        cond_field_name = '%s."%s"' % (self.table_alias(), field.db_field_name)
+                    else:
+                        cond_field_name = '%s."%s"' % (self.lookup_table_alias(field), field.lookup_db_field)
+
+            if filter_type == common.FILTER_CONTAINS:
+                value = '%' + value + '%'
+            elif filter_type == common.FILTER_STARTWITH:
+                value = value + '%'
+            elif filter_type == common.FILTER_ENDWITH:
+                value = '%' + value
+            upper_function =  db_module.upper_function()
+            if upper_function:
+                cond_string = upper_function + '(%s) %s %s'
+                value = value.upper()
+            if params is None:
+                value = "'" + value + "'"
+            else:
+                params.append(value)
+                value = db_module.value_literal(len(params))
+            if esc_found:
+                value = value + " ESCAPE '" + esc_char + "'"
+        elif params is None:
+            value = self._convert_field_value(field, value, filter_type, db_module)
+        else:
+            value = self._bind_field_value(field, value, filter_type, db_module, params)
         sql = cond_string % (cond_field_name, filter_sign, value)
-        if field.data_type == common.BOOLEAN and value == '0':
+        if bool_false and not filter_type in (common.FILTER_IN, common.FILTER_NOT_IN,
+            common.FILTER_RANGE, common.FILTER_ISNULL, common.FILTER_CONTAINS,
+            common.FILTER_STARTWITH, common.FILTER_ENDWITH):
             if filter_sign == '=':
                 sql = '(' + sql + ' OR %s IS NULL)' % cond_field_name
             elif filter_sign == '<>':
@@ -464,7 +610,46 @@ class SQL(object):
                 raise Exception('sql.py where_clause method: boolen field condition may give ambiguious results.')
         return sql
 
-    def where_clause(self, query, db_module=None):
+    def _get_ci_condition(self, field, filter_type, value, db_module, params=None):
+        esc_char = '/'
+        cond_field_name = '%s."%s"' % (self.table_alias(), field.db_field_name + common.CI_FIELD_SUFFIX)
+        value = value.upper()
+        if filter_type == common.FILTER_STARTWITH and value and \
+            db_module.CI_PREFIX_RANGE and ord(value[-1]) < 0xFFFF:
+            bounds = []
+            for bound in (value, value[:-1] + unichr(ord(value[-1]) + 1)):
+                if params is None:
+                    bounds.append("'" + bound.replace("'", "''") + "'")
+                else:
+                    params.append(bound)
+                    bounds.append(db_module.value_literal(len(params)))
+            return '(%s >= %s AND %s < %s)' % (cond_field_name, bounds[0], cond_field_name, bounds[1])
+        value, esc_found = self._escape_search(value, esc_char, params is None)
+        if filter_type == common.FILTER_CONTAINS:
+            value = '%' + value + '%'
+        elif filter_type == common.FILTER_STARTWITH:
+            value = value + '%'
+        elif filter_type == common.FILTER_ENDWITH:
+            value = '%' + value
+        if params is None:
+            value = "'" + value + "'"
+        else:
+            params.append(value)
+            value = db_module.value_literal(len(params))
+        if esc_found:
+            value = value + " ESCAPE '" + esc_char + "'"
+        return '%s LIKE %s' % (cond_field_name, value)
+
+    def _get_fts_value(self, field, value, db_module, params=None):
+        if self.fts and self._is_search_field(field):
+            value = db_module.fts_query(field.db_field_name, to_unicode(value, 'utf-8').split())
+            if value:
+                if params is None:
+                    return "'" + value.replace("'", "''") + "'"
+                params.append(value)
+                return db_module.value_literal(len(params))
+
+    def where_clause(self, query, db_module=None, params=None, seek=False, setup=None):
         if db_module is None:
             db_module = self.task.db_module
         conditions = []
@@ -477,21 +662,111 @@ class SQL(object):
                     if field_name == self._deleted_flag:
                         deleted_in_filters = True
                     if filter_type == common.FILTER_CONTAINS_ALL:
-                        values = value.split()
-                        for val in values:
-                            conditions.append(self._get_condition(field, common.FILTER_CONTAINS, val, db_module))
+                        fts_value = self._get_fts_value(field, value, db_module, params)
+                        if fts_value:
+                            conditions.append(db_module.fts_condition(self.table_name, self.table_alias(),
+                                self._primary_key_db_field_name, field.db_field_name, fts_value))
+                        else:
+                            values = value.split()
+                            for val in values:
+                                conditions.append(self._get_condition(field, common.FILTER_CONTAINS, val, db_module, params))
                     elif filter_type in [common.FILTER_IN, common.FILTER_NOT_IN] and \
                         type(value) in [tuple, list] and len(value) == 0:
                         conditions.append('%s."%s" IN (NULL)' % (self.table_alias(), self._primary_key_db_field_name))
+                    elif filter_type in [common.FILTER_IN, common.FILTER_NOT_IN] and \
+                        type(value) in [tuple, list] and len(value) > MAX_IN_LIST:
+                        conditions.append(self._get_in_list_condition(field, filter_type, value, db_module, params, setup))
                     else:
-                        conditions.append(self._get_condition(field, filter_type, value, db_module))
+                        conditions.append(self._get_condition(field, filter_type, value, db_module, params))
         if not deleted_in_filters and self._deleted_flag:
             conditions.append('%s."%s"=0' % (self.table_alias(), self._deleted_flag_db_field_name))
+        if seek:
+            seek_condition = self.keyset_condition(query, db_module, params)
+            if seek_condition:
+                conditions.append(seek_condition)
         result = ' AND '.join(conditions)
         if result:
             result = ' WHERE ' + result
         return result
 
+    def keyset_orders(self, query, db_module=None):
+        if not '__keyset' in query or query.get('__funcs') or query.get('__group_by'):
+            return
+        order_list = query.get('__order', [])
+        if not order_list and self.fts_order(query, db_module or self.task.db_module):
+            return
+        pk_field = self._field_by_name(self._primary_key)
+        if not pk_field:
+            return
+        result = []
+        for field_id, desc in order_list:
+            field = self._field_by_ID(field_id)
+            if not field:
+                continue
+            if field.lookup_item or field.calculated or \
+                not (field.required or field is pk_field):
+                return
+            result.append((field, desc))
+            if field is pk_field:
+                return result
+        result.append((pk_field, False))
+        return result
+
+    def keyset_values(self, query, db_module=None):
+        orders = self.keyset_orders(query, db_module)
+        values = query.get('__keyset')
+        if orders and values and len(values) == len(orders) and \
+            not [value for value in values if value is None]:
+            return orders, values
+
+    def _bind_keyset_value(self, field, value, db_module, params):
+        if field.data_type == common.DATETIME and not type(value) in string_types:
+            params.append(value)
+            return db_module.value_literal(len(params))
+        return self._bind_field_value(field, value, common.FILTER_GT, db_module, params)
+
+    def keyset_condition(self, query, db_module, params):
+        keyset = self.keyset_values(query, db_module)
+        if keyset:
+            orders, values = keyset
+            fields = ['%s."%s"' % (self.table_alias(), field.db_field_name) for field, desc in orders]
+            field, desc = orders[0]
+            sign = '>='
+            if desc:
+                sign = '<='
+            result = '%s %s %s' % (fields[0], sign, self._bind_keyset_value(field, values[0], db_module, params))
+            conditions = []
+            for i, (field, desc) in enumerate(orders):
+                condition = []
+                for j in range(i):
+                    condition.append('%s = %s' % (fields[j],
+                        self._bind_keyset_value(orders[j][0], values[j], db_module, params)))
+                sign = '>'
+                if desc:
+                    sign = '<'
+                condition.append('%s %s %s' % (fields[i], sign,
+                    self._bind_keyset_value(field, values[i], db_module, params)))
+                conditions.append('(%s)' % ' AND '.join(condition))
+            return '%s AND (%s)' % (result, ' OR '.join(conditions))
+
+    def _get_in_list_condition(self, field, filter_type, value, db_module, params, setup):
+        result = None
+        if params is not None and setup is not None:
+            values = []
+            for val in value:
+                self._bind_field_value(field, val, filter_type, db_module, values)
+            result = db_module.in_list_sql('%s."%s"' % (self.table_alias(), field.db_field_name),
+                field.data_type, values, params, setup)
+        if result is None:
+            conditions = []
+            for i in range(0, len(value), MAX_IN_LIST):
+                conditions.append(self._get_condition(field, common.FILTER_IN,
+                    value[i:i + MAX_IN_LIST], db_module, params))
+            result = '(%s)' % ' OR '.join(conditions)
+        if filter_type == common.FILTER_NOT_IN:
+            result = 'NOT %s' % result
+        return result
+
     def group_clause(self, query, fields, db_module=None):
         if db_module is None:
             db_module = self.task.db_module
@@ -514,7 +789,17 @@ class SQL(object):
         else:
             return ''
 
-    def order_clause(self, query, db_module=None):
+    def fts_order(self, query, db_module, params=None):
+        if self.fts:
+            for (field_name, filter_type, value) in query['__filters']:
+                if filter_type == common.FILTER_CONTAINS_ALL and value:
+                    field = self._field_by_name(field_name)
+                    fts_value = self._get_fts_value(field, value, db_module, params)
+                    if fts_value:
+                        return db_module.fts_rank(self.table_name, self.table_alias(),
+                            self._primary_key_db_field_name, field.db_field_name, fts_value)
+
+    def order_clause(self, query, db_module=None, params=None):
         if query.get('__funcs') and not query.get('__group_by'):
             return ''
         funcs = query.get('__funcs')
@@ -546,54 +831,65 @@ class SQL(object):
                 if order[1]:
                     ord_str += ' DESC'
                 orders.append(ord_str)
+        keyset_orders = self.keyset_orders(query, db_module)
+        if keyset_orders:
+            orders = []
+            for field, desc in keyset_orders:
+                ord_str = '%s."%s"' % (self.table_alias(), field.db_field_name)
+                if desc:
+                    ord_str += ' DESC'
+                orders.append(ord_str)
+        elif not order_list and not query.get('__group_by'):
+            fts_order = self.fts_order(query, db_module, params)
+            if fts_order:
+                orders.append(fts_order)
         if orders:
              result = ' ORDER BY %s' % ', '.join(orders)
         else:
             result = ''
         return result
 
-    def split_query(self, query):
-        MAX_IN_LIST = 1000
-        filters = query['__filters']
-        filter_index = -1
-        max_list = 0
-        if filters:
-            for i, (field_name, filter_type, value) in enumerate(filters):
-                if filter_type in [common.FILTER_IN, common.FILTER_NOT_IN]:
-                    length = len(value)
-                    if length > MAX_IN_LIST and length > max_list:
-                        max_list = length
-                        filter_index = i
-        if filter_index != -1:
-            lists = []
-            value_list = filters[filter_index][2]
-            while True:
-                values = value_list[0:MAX_IN_LIST]
-                if values:
-                    lists.append(values)
-                value_list = value_list[MAX_IN_LIST:]
-                if not value_list:
-                    break;
-            return filter_index, lists
+    def get_converters(self, query, db_module=None):
+        if db_module is None:
+            db_module = self.task.db_module
+        field_list = query['__fields']
+        if len(field_list):
+            fields = [self._field_by_name(field_name) for field_name in field_list]
+        else:
+            fields = self._fields
+        funcs = query.get('__funcs') or {}
+        funcs = [key.upper() for key, value in iteritems(funcs) if not value.upper() in ('MAX', 'MIN')]
+        data_types = []
+        for field in fields:
+            if not field.master_field:
+                if field.calculated or field.field_name.upper() in funcs:
+                    data_types.append(None)
+                else:
+                    data_types.append(field.data_type)
+        return db_module.get_converters(data_types)
+
+    def convert_rows(self, rows, converters):
+        for row in rows:
+            for i, convert in converters:
+                row[i] = convert(row[i])
+        return rows
 
     def get_select_queries(self, query, db_module=None):
-        result = []
-        filter_in_info = self.split_query(query)
-        if filter_in_info:
-            filter_index, lists = filter_in_info
-            for lst in lists:
-                query['__limit'] = None
-                query['__offset'] = None
-                query['__filters'][filter_index][2] = lst
-                result.append(self.get_select_query(query, db_module))
-        else:
-            result.append(self.get_select_query(query, db_module))
-        return result
+        return [self.get_select_query(query, db_module)]
 
     def get_select_statement(self, query, db_module=None): # depricated
         return self.get_select_query(query, db_module)
 
     def get_select_query(self, query, db_module=None):
+        return self._get_select_sql(query, db_module)
+
+    def get_select_command(self, query, db_module=None):
+        params = []
+        setup = []
+        sql = self._get_select_sql(query, db_module, params, setup)
+        return self.setup_command(setup, sql, params)
+
+    def _get_select_sql(self, query, db_module=None, params=None, setup=None):
         try:
             if db_module is None:
                 db_module = self.task.db_module
@@ -602,42 +898,63 @@ class SQL(object):
                 fields = [self._field_by_name(field_name) for field_name in field_list]
             else:
                 fields = self._fields
+            seek = params is not None
+            if seek and self.keyset_values(query, db_module):
+                query = dict(query)
+                query['__offset'] = 0
             start = self.fields_clause(query, fields, db_module)
+            if seek and self.count_over(query, db_module):
+                query = dict(query)
+                query['__count_over'] = True
+                start += ', COUNT(*) OVER() %s "JAM_COUNT"' % db_module.FIELD_AS
             end = ''.join([
                 self.from_clause(query, fields, db_module),
-                self.where_clause(query, db_module),
+                self.where_clause(query, db_module, params, seek=seek, setup=setup),
                 self.group_clause(query, fields, db_module),
-                self.order_clause(query, db_module)
+                self.order_clause(query, db_module, params)
             ])
-            sql = db_module.get_select(query, start, end, fields)
-            return sql
+            return db_module.get_select(query, start, end, fields)
         except Exception as e:
             traceback.print_exc()
             raise
 
+    def count_over(self, query, db_module=None):
+        if db_module is None:
+            db_module = self.task.db_module
+        return bool(query.get('__count') and query.get('__limit') and db_module.COUNT_OVER and \
+            not query.get('__funcs') and not query.get('__group_by') and \
+            not self.keyset_values(query, db_module))
+
     def get_record_count_queries(self, query, db_module=None):
-        result = []
-        filter_in_info = self.split_query(query)
-        if filter_in_info:
-            filter_index, lists = filter_in_info
-            for lst in lists:
-                query['__filters'][filter_index][2] = lst
-                result.append(self.get_record_count_query(query, db_module))
-        else:
-            result.append(self.get_record_count_query(query, db_module))
-        return result
+        return [self.get_record_count_query(query, db_module)]
 
     def get_record_count_query(self, query, db_module=None):
+        return self._get_record_count_sql(query, db_module)
+
+    def get_record_count_command(self, query, db_module=None):
+        params = []
+        setup = []
+        sql = self._get_record_count_sql(query, db_module, params, setup)
+        return self.setup_command(setup, sql, params)
+
+    def _get_record_count_sql(self, query, db_module=None, params=None, setup=None):
         if db_module is None:
             db_module = self.task.db_module
         fields = []
         filters = query['__filters']
         if filters:
             for (field_name, filter_type, value) in filters:
-                fields.append(self._field_by_name(field_name))
-        sql = 'SELECT COUNT(*) FROM %s %s' % (self.from_clause(query, fields, db_module),
-            self.where_clause(query, db_module))
-        return sql
+                field = self._field_by_name(field_name)
+                if field.lookup_item and filter_type in [common.FILTER_CONTAINS,
+                    common.FILTER_STARTWITH, common.FILTER_ENDWITH, common.FILTER_CONTAINS_ALL]:
+                    fields.append(field)
+        return 'SELECT COUNT(*) FROM %s %s' % (self.from_clause(query, fields, db_module),
+            self.where_clause(query, db_module, params, setup=setup))
+
+    def setup_command(self, setup, sql, params):
+        if setup:
+            return setup + [(sql, params)]
+        return sql, params
 
     def create_table_sql(self, db_type, table_name, fields=None, gen_name=None, foreign_fields=None):
         if not fields:
@@ -655,6 +972,9 @@ class SQL(object):
         result = []
         db_module = db_modules.get_db_module(db_type)
         result = db_module.create_table_sql(table_name, fields, gen_name, foreign_fields)
+        for field in fields:
+            if field.get('ci_field'):
+                result.append(self.create_ci_index_sql(db_module, table_name, field))
         for i, s in enumerate(result):
             print(result[i])
         return result
@@ -761,6 +1081,9 @@ class SQL(object):
                     comp[field['field_name']] = [None, field]
         for key, (old_field, new_field) in iteritems(comp):
             if old_field and not new_field and db_type != db_modules.SQLITE:
+                if old_field.get('ci_field'):
+                    result.append(db_module.delete_index(table_name,
+                        '%s_CI_%s' % (table_name, old_field['ci_field_id'])))
                 result.append(db_module.del_field_sql(table_name, old_field))
         for key, (old_field, new_field) in iteritems(comp):
             if old_field and new_field and db_type != db_modules.SQLITE:
@@ -776,10 +1099,18 @@ class SQL(object):
         for key, (old_field, new_field) in iteritems(comp):
             if not old_field and new_field:
                 result.append(db_module.add_field_sql(table_name, new_field))
+                if new_field.get('ci_field'):
+                    result.append('UPDATE "%s" SET "%s" = UPPER("%s")' % (table_name,
+                        new_field['field_name'], new_field['ci_field']))
+                    result.append(self.create_ci_index_sql(db_module, table_name, new_field))
         for i, s in enumerate(result):
             print(result[i])
         return result
 
+    def create_ci_index_sql(self, db_module, table_name, field):
+        return db_module.create_index_sql('%s_CI_%s' % (table_name, field['ci_field_id']),
+            table_name, '', db_module.ci_index_field(field['field_name']), '')
+
     def create_index_sql(self, db_type, table_name, fields=None, new_fields=None, foreign_key_dict=None):
 
         def new_field_name_by_id(id_value):
@@ -818,11 +1149,14 @@ class SQL(object):
             if self.f_unique_index.value:
                 unique = 'UNIQUE'
             fields = common.load_index_fields(index_fields)
+            if not new_fields:
+                db_field_names = self.task.sys_fields.field_values_by_ids(
+                    [field[0] for field in fields], 'f_db_field_name')
             if db_type == db_modules.FIREBIRD:
                 if new_fields:
                     field_defs = [new_field_name_by_id(field[0]) for field in fields]
                 else:
-                    field_defs = [self.task.sys_fields.field_by_id(field[0], 'f_db_field_name') for field in fields]
+                    field_defs = [db_field_names[field[0]][0] for field in fields]
                 field_str = '"' + '", "'.join(field_defs) + '"'
             else:
                 field_defs = []
@@ -830,7 +1164,7 @@ class SQL(object):
                     if new_fields:
                         field_name = new_field_name_by_id(field[0])
                     else:
-                        field_name = self.task.sys_fields.field_by_id(field[0], 'f_db_field_name')
+                        field_name = db_field_names[field[0]][0]
                     d = ''
                     if field[1]:
                         d = 'DESC'
@@ -231,6 +231,43 @@ class App():
         response.set_data(buff)
         return response
 
+    def create_stream_response(self, request, result, rows):
+        accepts_gzip = 0
+        try:
+            if request.environ.get("HTTP_ACCEPT_ENCODING").find("gzip") != -1:
+                accepts_gzip = 1
+        except:
+            pass
+        marker = '__stream_rows__'
+        result['result']['data'] = marker
+        head, tail = json.dumps(result, default=common.json_defaul_handler).split('"%s"' % marker)
+
+        def generate():
+            error = ''
+            sep = ''
+            yield to_bytes(head + '[[', 'utf-8')
+            try:
+                for batch in rows:
+                    if batch:
+                        buff = json.dumps(batch, default=common.json_defaul_handler)
+                        yield to_bytes(sep + buff[1:-1], 'utf-8')
+                        sep = ','
+            except Exception as e:
+                traceback.print_exc()
+                error = error_message(e)
+            finally:
+                rows.close()
+            yield to_bytes('], %s]%s' % (json.dumps(error), tail), 'utf-8')
+
+        chunks = generate()
+        if accepts_gzip:
+            chunks = common.compressStream(chunks)
+        response = Response(chunks, direct_passthrough=True)
+        response.headers['Content-Type'] = 'application/json'
+        if accepts_gzip:
+            response.headers['Content-encoding'] = 'gzip'
+        return response
+
     def get_client_address(self, request):
         try:
             return request.environ['HTTP_X_FORWARDED_FOR'].split(',')[-1].strip()
@@ -334,6 +371,7 @@ class App():
         error = ''
         if request.method == 'POST':
             r = {'result': None, 'error': None}
+            stream = None
             try:
                 data = request.get_data()
                 if type(data) != str:
@@ -365,13 +403,17 @@ class App():
                         item = task
                         if task and item_id:
                             item = task.item_by_ID(item_id)
+                        jam.context.api = (item.item_name, method)
                         self._busy += 1
                         try:
                             data = None
                             started = datetime.datetime.now()
                             if task.on_before_request:
                                 data = task.on_before_request(item, method, params)
-                            if not data:
+                            if not data and method == 'open' and type(params) == dict and \
+                                params.get('__stream'):
+                                stream = item.select_records_stream(params, safe=True)
+                            if not data and stream is None:
                                 data = self.get_response(item, method, params)
                             if task.on_after_request:
                                 task.on_after_request(item, method, params, datetime.datetime.now() - started)
@@ -391,7 +433,10 @@ class App():
                     raise
                 r['result'] = {'data': [None, error]}
                 r['error'] = error
-            response = self.create_post_response(request, r)
+            if stream is not None and not r['error']:
+                response = self.create_stream_response(request, r, stream)
+            else:
+                response = self.create_post_response(request, r)
             request.save_session(response, self, task)
             return response
 
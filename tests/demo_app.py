@@ -0,0 +1,31 @@
+import os
+import shutil
+import tempfile
+
+DEMO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'demo')
+
+class App(object):
+    task = None
+    under_maintenance = False
+    _busy = 0
+
+_app = None
+
+def get_app():
+    global _app
+    if _app is None:
+        project_dir = os.path.join(tempfile.mkdtemp(), 'demo')
+        shutil.copytree(DEMO_DIR, project_dir)
+        os.chdir(project_dir)
+        from jam.adm_server import create_admin
+        app = App()
+        app.admin = create_admin(app)
+        app.task = app.admin.create_task()
+        _app = app
+    return _app
+
+def get_task():
+    return get_app().task
+
+def get_admin():
+    return get_app().admin
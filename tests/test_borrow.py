@@ -0,0 +1,55 @@
+import unittest
+
+from tests.demo_app import get_task
+
+class BorrowTest(unittest.TestCase):
+
+    def test_reset_state(self):
+        invoices = get_task().invoices
+        with invoices.borrow() as c:
+            c.set_where(customer=1)
+            c.set_order_by('-date')
+            c.soft_delete = False
+            c.on_before_open = lambda item, params: None
+            c.invoice_table.disabled = True
+            c.customer.read_only = True
+            c.open(limit=1)
+            copy_id = id(c)
+        with invoices.borrow() as c:
+            self.assertEqual(id(c), copy_id)
+            self.assertFalse(c.active)
+            self.assertEqual(c._where_list, [])
+            self.assertEqual(c._order_by_list, [])
+            self.assertEqual(c.soft_delete, invoices.soft_delete)
+            self.assertEqual(c.on_before_open, invoices.on_before_open)
+            self.assertEqual(c.invoice_table.disabled, invoices.invoice_table.disabled)
+            self.assertFalse(c.customer.read_only)
+
+    def test_reset_fields(self):
+        invoices = get_task().invoices
+        with invoices.borrow() as c:
+            c.open(fields=['id', 'total'], limit=1)
+            self.assertEqual(len(c.fields), 2)
+            c.invoice_table.open(fields=['id', 'quantity'])
+            copy_id = id(c)
+        with invoices.borrow() as c:
+            self.assertEqual(id(c), copy_id)
+            self.assertEqual(len(c.fields), len(c._fields))
+            self.assertEqual(len(c.invoice_table.fields), len(c.invoice_table._fields))
+            self.assertTrue(c.field_by_name('customer') is c.customer)
+            c.open(limit=1)
+            self.assertEqual(c.record_count(), 1)
+            self.assertTrue(c.customer.value)
+
+    def test_exception_discards_copy(self):
+        invoices = get_task().invoices
+        with invoices.borrow() as c:
+            copy_id = id(c)
+        try:
+            with invoices.borrow() as c:
+                self.assertEqual(id(c), copy_id)
+                raise ValueError
+        except ValueError:
+            pass
+        with invoices.borrow() as c:
+            self.assertNotEqual(id(c), copy_id)
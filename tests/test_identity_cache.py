@@ -0,0 +1,46 @@
+import unittest
+
+import jam
+from werkzeug.local import Local
+from tests.demo_app import get_task
+
+class IdentityCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        jam.context = Local()
+        jam.context.environ = {}
+
+    def tearDown(self):
+        task = get_task()
+        if 'execute' in task.__dict__:
+            del task.execute
+        del jam.context
+
+    def test_field_values_by_ids(self):
+        customers = get_task().customers.copy()
+        customers.open(limit=2)
+        ids = [c.id.value for c in customers]
+        names = dict((c.id.value, [c.lastname.value]) for c in customers)
+        self.assertEqual(customers.field_values_by_ids(ids, 'lastname'), names)
+        self.assertEqual(customers.field_values_by_ids([str(i) for i in ids], 'lastname'),
+            dict((str(i), names[i]) for i in ids))
+        self.assertEqual(customers.field_by_id(ids[0], 'lastname'), names[ids[0]][0])
+
+    def test_apply_delta_clears_cache(self):
+        task = get_task()
+        customers = task.customers.copy()
+        customers.open(limit=1)
+        id_value = customers.id.value
+        customers.field_values_by_ids([id_value], 'lastname')
+        self.assertTrue(jam.context.identity_cache)
+        customers.edit()
+        customers.lastname.value = 'Changed'
+        customers.post()
+        changes = {}
+        customers.change_log.get_changes(changes)
+        def execute(command, params=None, call_proc=False, select=False):
+            raise Exception('connection lost')
+        task.execute = execute
+        with self.assertRaises(Exception):
+            customers.apply_delta(customers.delta(changes))
+        self.assertEqual(jam.context.identity_cache, {})
@@ -0,0 +1,26 @@
+import unittest
+
+from tests.demo_app import get_task
+
+class PrefetchDetailsTest(unittest.TestCase):
+
+    def test_prefetch_keeps_detail_open_params(self):
+        invoices = get_task().invoices.copy()
+        detail = invoices.invoice_table
+        detail._open_params = {'__marker': True}
+        detail.set_where(quantity__gt=0)
+        where_list = list(detail._where_list)
+        detail.prefetch_records([1, 2])
+        self.assertEqual(detail._open_params, {'__marker': True})
+        self.assertEqual(detail._where_list, where_list)
+
+    def test_prefetched_detail_open(self):
+        invoices = get_task().invoices.copy()
+        invoices.details_active = True
+        invoices.open(limit=5, prefetch_details=['invoice_table'])
+        for i in invoices:
+            ids = [d.id.value for d in invoices.invoice_table]
+            self.assertTrue(ids)
+            self.assertFalse(isinstance(invoices.invoice_table._open_params.get('__master_rec_id'), list))
+            invoices.invoice_table.open()
+            self.assertEqual([d.id.value for d in invoices.invoice_table], ids)
@@ -0,0 +1,53 @@
+import unittest
+
+import jam
+from jam.server_classes import parse_dsn
+from werkzeug.local import Local
+from tests.demo_app import get_task
+
+class ReadReplicasTest(unittest.TestCase):
+
+    def tearDown(self):
+        task = get_task()
+        task.last_write = None
+        if hasattr(jam, 'context'):
+            del jam.context
+
+    def test_parse_dsn(self):
+        self.assertEqual(parse_dsn('reader:secret@db2:5433/demo'),
+            ('demo', 'reader', 'secret', 'db2', '5433'))
+        self.assertEqual(parse_dsn('reader@db2/demo'), ('demo', 'reader', '', 'db2', ''))
+        self.assertEqual(parse_dsn('/var/db/demo.sqlite'), ('/var/db/demo.sqlite', '', '', '', ''))
+
+    def test_add_read_replicas_setting(self):
+        task = get_task()
+        pools = list(task.read_pools)
+        try:
+            task.add_read_replicas(' %s , ' % task.db_database)
+            self.assertEqual(len(task.read_pools), len(pools) + 1)
+            self.assertEqual(task.read_pools[-1].db_database, task.db_database)
+        finally:
+            task.read_pools = pools
+
+    def test_sticky_without_session(self):
+        task = get_task()
+        self.assertTrue(task.read_pools)
+        self.assertTrue(task.get_read_pool() is not None)
+        task.register_write()
+        self.assertTrue(task.get_read_pool() is None)
+        task.last_write -= task.read_sticky_time
+        self.assertTrue(task.get_read_pool() is not None)
+
+    def test_sticky_per_request(self):
+        task = get_task()
+        jam.context = Local()
+        jam.context.environ = {}
+        task.register_write()
+        self.assertTrue(task.get_read_pool() is None)
+        self.assertTrue(task.last_write is None)
+        jam.context = Local()
+        jam.context.environ = {}
+        self.assertTrue(task.get_read_pool() is not None)
+
+if __name__ == '__main__':
+    unittest.main()
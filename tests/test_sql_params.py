@@ -0,0 +1,57 @@
+import datetime
+import unittest
+
+import jam.common as common
+from werkzeug._compat import string_types
+from tests.demo_app import get_task, get_admin
+
+class FilterParamsTest(unittest.TestCase):
+
+    def test_public_queries_return_sql(self):
+        cust = get_task().customers.copy()
+        cust.open(limit=1)
+        params = cust._open_params
+        self.assertTrue(isinstance(cust.get_select_query(params), string_types))
+        self.assertTrue(isinstance(cust.get_select_statement(params), string_types))
+        self.assertTrue(isinstance(cust.get_record_count_query(params), string_types))
+        sql, sql_params = cust.get_select_command(params)
+        self.assertEqual(sql_params, [])
+
+    def test_inline_and_bound_queries_match(self):
+        task = get_task()
+        cust = task.customers.copy()
+        cust.set_where(lastname__startwith='B', country__ne='USA')
+        cust.open()
+        params = cust._open_params
+        rows = task.execute_select(cust.get_select_query(params))
+        self.assertEqual(len(rows), cust.record_count())
+        self.assertEqual(rows, task.execute_select(cust.get_select_command(params)))
+
+    def test_datetime_boundary(self):
+        task = get_task()
+        inv = task.invoices.copy()
+        inv.date.data_type = common.DATETIME
+        inv.open(fields=['id', 'date'], limit=1)
+        rec_id = inv.id.value
+        task.execute("UPDATE DEMO_INVOICES SET \"DATE\" = '2017-12-16 10:20' WHERE ID = %s" % rec_id)
+        try:
+            value = datetime.datetime(2017, 12, 16, 10, 20, 45)
+            inv.open(fields=['id'], where={'id': rec_id, 'date__ge': value})
+            self.assertEqual(inv.record_count(), 1)
+            self.assertTrue('2017-12-16 10:20' in inv.get_select_command(inv._open_params)[1])
+            inv.open(fields=['id'], where={'id': rec_id, 'date__gt': value})
+            self.assertEqual(inv.record_count(), 0)
+        finally:
+            task.execute("UPDATE DEMO_INVOICES SET \"DATE\" = '2017-12-16' WHERE ID = %s" % rec_id)
+
+    def test_boolean_string_filter(self):
+        items = get_admin().sys_items.copy()
+        items.open(fields=['id'], where={'f_visible': True})
+        visible = items.record_count()
+        items.open(fields=['id'], where={'f_visible': 'true'})
+        self.assertEqual(items.record_count(), visible)
+        sql, sql_params = items.get_select_command(items._open_params)
+        self.assertEqual(sql_params, [1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from jam.execute import StatementCache
+from tests.demo_app import get_task
+
+class Cursor(object):
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, command, params=None):
+        self.commands.append(command)
+
+class PreparingModule(object):
+    def __init__(self):
+        self.prepared = []
+        self.deallocated = []
+
+    def prepare_statement(self, cursor, name, command):
+        self.prepared.append(command)
+        return name, 'EXECUTE %s' % name
+
+    def deallocate_statement(self, cursor, name):
+        self.deallocated.append(name)
+
+class StatementCacheTest(unittest.TestCase):
+
+    def test_prepares_repeated_statements_only(self):
+        db_module = PreparingModule()
+        cursor = Cursor()
+        cache = StatementCache(db_module, size=2, prepare_after=3)
+        for i in range(5):
+            cache.execute(cursor, 'SELECT %d' % i, [])
+        self.assertEqual(db_module.prepared, [])
+        for i in range(4):
+            cache.execute(cursor, 'SELECT ?', [i])
+        self.assertEqual(db_module.prepared, ['SELECT ?'])
+        self.assertEqual(cursor.commands[-2:], ['EXECUTE JAM_STMT_1', 'EXECUTE JAM_STMT_1'])
+        self.assertEqual((cache.hits, cache.misses), (1, 8))
+
+    def test_evicted_statements_are_deallocated(self):
+        db_module = PreparingModule()
+        cache = StatementCache(db_module, size=1, prepare_after=1)
+        cache.execute(Cursor(), 'SELECT 1', [])
+        cache.execute(Cursor(), 'SELECT 2', [])
+        self.assertEqual(db_module.deallocated, ['JAM_STMT_1'])
+
+    def test_no_statement_stats_without_prepare(self):
+        stats = get_task().pool_stats()
+        if stats:
+            self.assertFalse('statement_hits' in stats)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from tests.demo_app import get_task
+
+class UpdateDeletedTest(unittest.TestCase):
+
+    def apply_deleted(self, count, details=None):
+        invoices = get_task().invoices.copy()
+        invoices.open(limit=count)
+        expected = {}
+        for i in invoices:
+            invoices.invoice_table.open()
+            expected[invoices.id.value] = sorted(d.id.value for d in invoices.invoice_table)
+        invoices.first()
+        while not invoices.eof():
+            invoices.delete()
+        changes = {}
+        invoices.change_log.get_changes(changes)
+        result = {}
+        def on_apply(item, delta, params):
+            delta.update_deleted(details)
+            result['current'] = (delta.id.value, sorted(d.id.value for d in delta.invoice_table))
+            for d in delta:
+                result[d.id.value] = sorted(t.id.value for t in d.invoice_table)
+            return changes, None
+        invoices.on_apply = on_apply
+        invoices.apply_changes((changes, {}), False)
+        return expected, result
+
+    def test_single_record_delete(self):
+        expected, result = self.apply_deleted(1)
+        id_value, rows = result.pop('current')
+        self.assertTrue(rows)
+        self.assertEqual(rows, expected[id_value])
+        self.assertEqual(result, expected)
+
+    def test_several_records_delete(self):
+        expected, result = self.apply_deleted(3)
+        id_value, rows = result.pop('current')
+        self.assertEqual(rows, expected[id_value])
+        self.assertEqual(result, expected)